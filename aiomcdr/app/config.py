@@ -10,6 +10,30 @@ class RconConfig:
     address: str = "127.0.0.1"
     port: int = 25575
     password: str = "password"
+    pool_size: int = 2
+    """The number of connections to keep, queries are spread among them"""
+    max_in_flight: int = 16
+    """The maximum number of commands waiting for their responses on a connection, 0 for unlimited"""
+    timeout: float = 10
+    """The seconds to wait for connecting, logging in and the response of a query"""
+    player_list_interval: float = 0
+    """The seconds between correcting the online players with the list command, 0 to disable"""
+
+
+@dataclass
+class AutoRestartConfig:
+    enabled: bool = True
+    """Whether to start the server again after it exits without being asked to, the application exits if not"""
+    max_restarts: int = 5
+    """The maximum number of automatic restarts within the window, 0 for no limit. The application exits beyond it"""
+    window: float = 600
+    """The seconds in which the automatic restarts are counted"""
+    backoff_initial: float = 1
+    """The seconds to wait before the second restart in a row, doubled for each restart after it"""
+    backoff_max: float = 60
+    """The maximum seconds to wait before an automatic restart"""
+    healthy_uptime: float = 300
+    """The seconds the server has to keep running for the backoff to be reset"""
 
 
 @config("mcdr.main")
@@ -49,6 +73,70 @@ class MCDRConfig:
     """MCDR -> Server"""
     decoding: str | None = None
     """Server -> MCDR"""
+    stdout_read_mode: Literal["line", "chunk"] = "chunk"
+    """
+    The way to read the standard output of the server
+
+    line, read the output line by line
+    chunk, read the output in large chunks and split them into lines in bulk, recommended for servers with heavy logs
+    """
+    stdout_chunk_size: int = 65536
+    """The maximum bytes to read from the standard output of the server at once, only used in chunk mode"""
+    info_queue_size: int = 2560
+    """The maximum number of non-user infos waiting to be reacted, 0 for unlimited"""
+    info_queue_overflow_policy: Literal["block", "drop_oldest", "drop_newest"] = "block"
+    """
+    What to do when the info queue is full
+
+    block, wait until there's a free slot, the reading of server stdout will be paused
+    drop_oldest, discard the oldest non-user info in the queue
+    drop_newest, discard the info that is being put
+    Infos from players and the console are never discarded
+    """
+    stdin_buffer_size: int = 1048576
+    """The maximum bytes of the commands waiting to be written to the standard input of the server, 0 for unlimited"""
+    stdin_buffer_overflow_policy: Literal["block", "drop_oldest", "drop_newest"] = "block"
+    """
+    What to do with a command when the stdin buffer is full, e.g. when a plugin sends commands faster than the server
+    reads them
+
+    block, wait until there's a free space, the plugin sending the command will be paused
+    drop_oldest, discard the oldest commands in the buffer
+    drop_newest, discard the command that is being sent
+    """
+    info_batch_size: int = 1000
+    """The maximum number of infos in an InfoBatchEvent. Infos are only batched when InfoBatchEvent has listeners"""
+    info_batch_window: float = 0.1
+    """The maximum seconds an info waits in the batch before the InfoBatchEvent is posted"""
+    info_lazy_parsing: bool = False
+    """
+    Whether to decode the time and the logging level of a server output line only when they're read,
+    saves some parsing work on servers with heavy logs
+    """
+    listener_latency_budget: float = 0.1
+    """
+    The seconds a plugin listener may take to handle an event before a warning naming its plugin module is logged,
+    0 to disable the warning. Use the console command !!listeners to see the latency of all listeners
+    """
+    listener_dispatch_mode: Literal["wait", "detach"] = "wait"
+    """
+    How the listeners of the info and player events are invoked
+
+    wait, the next info is reacted to after the listeners of the current one are done
+    detach, the listeners are left running in the background, so a slow plugin never holds up the reaction to the
+    server output, but the listeners of consecutive infos may run at the same time
+    """
+    listener_timeout: float = 0
+    """The seconds a plugin listener may take to handle an event before it's cancelled, 0 for no limit"""
+    plugin_listener_concurrency: int = 16
+    """The maximum number of listeners of a plugin running at the same time, 0 for no limit"""
+    auto_restart: AutoRestartConfig = field(default_factory=lambda: AutoRestartConfig())
+    """
+    What to do when the server exits without being asked to, e.g. crashes or fails to start
+
+    A restarted server crashing again is restarted with a doubling delay, to keep a server failing at boot from
+    eating the CPU of the host
+    """
     rcon: RconConfig = field(default_factory=lambda: RconConfig())
     """
     rcon setting
@@ -1,14 +1,22 @@
 import functools
 import re
 import time
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Tuple, Union
 
-import parse
 from mcdreforged.utils import string_util
 from mcdreforged.utils.types import MessageText
 
+from aiomcdr.app.handler.compiled_format import CompiledFormat, compile_format
+from aiomcdr.app.handler.info_classifier import (
+    InfoClassification,
+    InfoClassifier,
+    ProbeKind,
+)
 from aiomcdr.app.info_reactor.info import Info, InfoSource
 from aiomcdr.app.info_reactor.server_information import ServerInformation
+from aiomcdr.app.server_phase import ServerPhase
+
+_LOGGING_LEVEL_RE = re.compile(r"\w+")
 
 
 class AbstractServerHandler:
@@ -31,6 +39,14 @@ class AbstractServerHandler:
             └── VelocityHandler
     """
 
+    __last_classified: Optional[Tuple[Info, Optional[ServerPhase], InfoClassification]] = None
+
+    lazy_parsing: bool = False
+    """
+    If the time and the logging level of the parsed infos are decoded from the raw line on their first access,
+    instead of right in :meth:`try_parse_server_stdout`
+    """
+
     # ---------------------
     #   Basic Information
     # ---------------------
@@ -61,6 +77,22 @@ class AbstractServerHandler:
         """
         raise NotImplementedError()
 
+    def get_send_message_commands(
+        self, targets: Iterable[str], message: MessageText, server_information: ServerInformation
+    ) -> List[str]:
+        """
+        The commands to send a message to each of the targets, as few as possible
+
+        By default it's a :meth:`get_send_message_command` for each target. Override it if the message can be
+        serialized only once, or several targets can share a command
+        """
+        commands = []
+        for target in dict.fromkeys(targets):
+            command = self.get_send_message_command(target, message, server_information)
+            if command is not None:
+                commands.append(command)
+        return commands
+
     def get_broadcast_message_command(
         self, message: MessageText, server_information: ServerInformation
     ) -> Optional[str]:
@@ -133,72 +165,128 @@ class AbstractServerHandler:
         The return value of the first succeeded ``parse.parse`` call will be used
         for filling fields of the :class:`~mcdreforged.info_reactor.info.Info` object
 
-        The return value should be a constant value
+        The return value should be a constant value, since it's compiled only once per handler class
         """
         raise NotImplementedError()
 
     @classmethod
     @functools.lru_cache()
-    def _get_content_parsers(cls) -> List[parse.Parser]:
+    def _get_content_parsers(cls) -> List[CompiledFormat]:
         """
         The return value is cached for reuse. Do not modify
         """
         formatters = cls.get_content_parsing_formatter()
         if isinstance(formatters, str):
             formatters = (formatters,)
-        return list(map(parse.Parser, formatters))
+        return list(map(compile_format, formatters))
 
     @classmethod
-    def _content_parse(cls, info: Info):
+    def _try_content_parse(cls, info: Info, lazy: bool = False) -> bool:
         """
-        A commonly used method to parse several generic elements from an un-parsed :class:`~mcdreforged.info_reactor.info.Info` object
-
-        Elements expected to be parsed includes:
-
-        - :attr:`info.hour <mcdreforged.info_reactor.info.Info.hour>`
-        - :attr:`info.min <mcdreforged.info_reactor.info.Info.min>`
-        - :attr:`info.sec <mcdreforged.info_reactor.info.Info.sec>`
-        - :attr:`info.logging <mcdreforged.info_reactor.info.Info.logging>`
-        - :attr:`info.content <mcdreforged.info_reactor.info.Info.content>`
+        The non-throwing version of :meth:`_content_parse`
 
         :param info: The to-be-processed :class:`~mcdreforged.info_reactor.info.Info` object
+        :param lazy: If only the content is filled now. The time and the logging level are deferred
+            until they're accessed, see :attr:`lazy_parsing`
+        :return: If the parsing succeeded. The info object is left untouched if it failed
         :meta public:
         """
         for parser in cls._get_content_parsers():
-            parsed: parse.Result = parser.parse(info.content)  # type: ignore
+            parsed = parser.parse(info.content, convert=not lazy)  # type: ignore
             if parsed is not None:
                 logging_level = parsed["logging"]
-                if re.fullmatch(r"\w+", logging_level) is None:
+                if _LOGGING_LEVEL_RE.fullmatch(logging_level) is None:
                     # logging level should be text only, just in case
                     # might happen in e.g. WaterfallHandler parsing "[01:23:45 INFO] [Test]: ping"
                     continue
                 break
         else:
-            raise ValueError(f"Unrecognized input: {info.content}")
+            return False
+        if lazy:
+            info.defer_fields(cls._get_deferred_fields_resolver())
+            info.content = parsed["content"]
+            return True
         info.hour = parsed["hour"]
         info.min = parsed["min"]
         info.sec = parsed["sec"]
         info.logging_level = parsed["logging"]
         info.content = parsed["content"]
+        return True
 
-    def parse_server_stdout(self, text: str) -> Info:
+    @classmethod
+    @functools.lru_cache()
+    def _get_deferred_fields_resolver(cls) -> Callable[[Info], None]:
+        """
+        The return value is cached for reuse, so that deferring costs no extra allocation per info
+        """
+        return cls._resolve_deferred_fields
+
+    @classmethod
+    def _resolve_deferred_fields(cls, info: Info):
+        """
+        Fill the fields deferred by a lazy :meth:`_try_content_parse`, by parsing the raw content of the info again
+
+        :meta public:
+        """
+        parsed = cls._get_server_stdout_raw_result(info.raw_content)
+        if cls._try_content_parse(parsed):
+            info.hour, info.min, info.sec = parsed.hour, parsed.min, parsed.sec
+            info.logging_level = parsed.logging_level
+
+    @classmethod
+    def _content_parse(cls, info: Info):
+        """
+        A commonly used method to parse several generic elements from an un-parsed :class:`~mcdreforged.info_reactor.info.Info` object
+
+        Elements expected to be parsed includes:
+
+        - :attr:`info.hour <mcdreforged.info_reactor.info.Info.hour>`
+        - :attr:`info.min <mcdreforged.info_reactor.info.Info.min>`
+        - :attr:`info.sec <mcdreforged.info_reactor.info.Info.sec>`
+        - :attr:`info.logging <mcdreforged.info_reactor.info.Info.logging>`
+        - :attr:`info.content <mcdreforged.info_reactor.info.Info.content>`
+
+        :param info: The to-be-processed :class:`~mcdreforged.info_reactor.info.Info` object
+        :raise ValueError: If the content of the info is not recognized
+        :meta public:
+        """
+        if not cls._try_content_parse(info):
+            raise ValueError(f"Unrecognized input: {info.content}")
+
+    def try_parse_server_stdout(self, text: str) -> Optional[Info]:
         """
         Main parsing operation. Parse a string from the stdout of the server and output a parsed info
 
-        It may raise any exceptions if the format of the input string is not correct
+        Unlike :meth:`parse_server_stdout`, it doesn't raise if the format of the input string is not recognized,
+        so that unparsable lines like java stack traces cost no exception
 
         In this default implementation, it firstly uses :meth:`_get_server_stdout_raw_result`
         to get a raw :class:`~mcdreforged.info_reactor.info.Info` object,
-        then use :meth:`_content_parse` to fill generic information into the :class:`~mcdreforged.info_reactor.info.Info` object,
+        then use :meth:`_try_content_parse` to fill generic information into the :class:`~mcdreforged.info_reactor.info.Info` object,
         finally returns that as a simply-parsed info
 
-        If the server handler is able to parse more information, you can do more post-parsing operations after invoking this method via ``super()``
+        If the server handler is able to parse more information, override this method
+        and do more post-parsing operations after invoking this method via ``super()``
 
         :param text: A line of the server stdout to be parsed
-        :return: An :class:`~mcdreforged.info_reactor.info.Info` object as the result
+        :return: An :class:`~mcdreforged.info_reactor.info.Info` object as the result, or None if the text is not recognized
         """
         info = self._get_server_stdout_raw_result(text)
-        self._content_parse(info)
+        if not self._try_content_parse(info, self.lazy_parsing):
+            return None
+        return info
+
+    def parse_server_stdout(self, text: str) -> Info:
+        """
+        The throwing version of :meth:`try_parse_server_stdout`
+
+        :param text: A line of the server stdout to be parsed
+        :return: An :class:`~mcdreforged.info_reactor.info.Info` object as the result
+        :raise ValueError: If the text is not recognized
+        """
+        info = self.try_parse_server_stdout(text)
+        if info is None:
+            raise ValueError(f"Unrecognized input: {text}")
         return info
 
     def parse_player_joined(self, info: Info) -> Optional[str]:
@@ -271,3 +359,113 @@ class AbstractServerHandler:
         :return: If the server is stopping
         """
         raise NotImplementedError()
+
+    def parse_death_message(self, info: Info) -> Optional[str]:
+        """
+        Check if the info is a player death message
+
+        If it is, returns the name of the dead player, otherwise returns None.
+        Not supported by default
+
+        :param info: The info object to be checked
+        :return: The name of the player, or None
+        """
+        return None
+
+    def parse_player_made_advancement(self, info: Info) -> Optional[Tuple[str, str]]:
+        """
+        Check if the info indicates a player made an advancement
+
+        If it is, returns the name of the player and the name of the advancement, otherwise returns None.
+        Not supported by default
+
+        :param info: The info object to be checked
+        :return: A tuple containing the name of the player and the name of the advancement, or None
+        """
+        return None
+
+    def parse_player_list(self, text: str) -> Optional[List[str]]:
+        """
+        Parse the response of the command listing the online players, e.g. the ``list`` command queried through rcon
+
+        Not supported by default
+
+        :param text: The response of the command
+        :return: The names of the online players, or None if the text is not recognized
+        """
+        return None
+
+    # ----------------------
+    #   Info classification
+    # ----------------------
+
+    @classmethod
+    def get_probe_prefixes(cls) -> Dict[ProbeKind, Iterable[str]]:
+        """
+        The literal prefixes of the info content that the probes accept, used by :meth:`classify`
+
+        A probe is only invoked if the info content starts with one of its prefixes or contains one of its keywords
+        (see :meth:`get_probe_keywords`). The comparison is case-insensitive.
+        Probes declared in neither of them are always invoked,
+        and a probe declared with no literal at all is never invoked
+
+        Remember to update the literals if you override a probe method.
+        The return value should be a constant value, since it's compiled only once per handler class
+        """
+        return {}
+
+    @classmethod
+    def get_probe_keywords(cls) -> Dict[ProbeKind, Iterable[str]]:
+        """
+        The literals contained anywhere in the info content that the probes accept, used by :meth:`classify`
+
+        See :meth:`get_probe_prefixes` for details
+        """
+        # unsupported by default, see the probe methods
+        return {ProbeKind.DEATH_MESSAGE: [], ProbeKind.PLAYER_MADE_ADVANCEMENT: []}
+
+    @classmethod
+    def get_probe_phases(cls) -> Dict[ProbeKind, Collection[ServerPhase]]:
+        """
+        The server phases in which the probes are useful, used by :meth:`classify`
+
+        Probes not declared here are invoked in every phase.
+        By default the probes for the server startup, the version and the address only work while the server is starting,
+        so that they don't run against every chat and log line for the whole lifetime of the server
+
+        The return value should be a constant value, since it's compiled only once per handler class
+        """
+        return {
+            ProbeKind.SERVER_STARTUP_DONE: [ServerPhase.STARTING],
+            ProbeKind.SERVER_VERSION: [ServerPhase.STARTING],
+            ProbeKind.SERVER_ADDRESS: [ServerPhase.STARTING],
+        }
+
+    @classmethod
+    @functools.lru_cache()
+    def _get_info_classifier(cls) -> InfoClassifier:
+        """
+        The return value is cached for reuse. Do not modify
+        """
+        return InfoClassifier(cls.get_probe_prefixes(), cls.get_probe_keywords(), cls.get_probe_phases())
+
+    def classify(self, info: Info, phase: Optional[ServerPhase] = None) -> InfoClassification:
+        """
+        Run all probes on the info in a single pass
+
+        Only the probes that might accept the info are invoked, picked by the literals from :meth:`get_probe_prefixes`
+        and :meth:`get_probe_keywords`, so an ordinary line costs a dict lookup and a few substring tests
+
+        The result of the last classified info is remembered, so classifying the same info object again is free
+
+        :param info: The info object to be classified
+        :param phase: The current phase of the server, the probes not for this phase are skipped
+            (see :meth:`get_probe_phases`). None to invoke the probes regardless of the phase
+        :return: The results of the probes
+        """
+        last_classified = self.__last_classified
+        if last_classified is not None and last_classified[0] is info and last_classified[1] is phase:
+            return last_classified[2]
+        classification = self._get_info_classifier().classify(self, info, phase)
+        self.__last_classified = (info, phase, classification)
+        return classification
@@ -0,0 +1,112 @@
+"""
+Format strings of ``parse.parse`` compiled into regular expressions
+"""
+import functools
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import parse
+
+FormatResult = Dict[Union[int, str], Any]
+
+_FIELD_RE = re.compile(r"(\{\{|\}\}|\{[^{}]*\})")
+_INT_PATTERN = r"[-+ ]?\d+|[-+ ]?0[xX][0-9a-fA-F]+|[-+ ]?0[bB][01]+|[-+ ]?0[oO][0-7]+"
+_int_convert = parse.int_convert()
+
+
+def _to_int(text: str) -> int:
+    return int(text) if text.isdigit() else _int_convert(text, None)
+
+
+class CompiledFormat:
+    """
+    A format string of ``parse.parse`` that is compiled into a regular expression only once
+
+    :meth:`parse` gives the same result as ``parse.parse(format, text)``, except that the result is a dict:
+    named fields are keyed by their names and anonymous fields are keyed by their indexes,
+    so both ``result["name"]`` and ``result[0]`` work like they do on a ``parse.Result``
+
+    Fields like ``{}``, ``{name}``, ``{:d}`` and ``{name:d}`` are translated into a plain regular expression.
+    Formats using other field types fall back to a cached ``parse.Parser``
+    """
+
+    def __init__(self, format: str):
+        self.format = format
+        self.__parser: Optional[parse.Parser] = None
+        try:
+            self.__pattern, self.__groups = self.__compile(format)
+        except ValueError:
+            self.__parser = parse.Parser(format)
+
+    @staticmethod
+    def __compile(format: str) -> Tuple["re.Pattern[str]", List[Tuple[Union[int, str], Optional[Callable]]]]:
+        expression: List[str] = []
+        groups: List[Tuple[Union[int, str], Optional[Callable]]] = []
+        named_types: Dict[str, str] = {}
+        for part in _FIELD_RE.split(format):
+            if not part:
+                continue
+            if part == "{{":
+                expression.append(r"\{")
+            elif part == "}}":
+                expression.append(r"\}")
+            elif part[0] == "{":
+                name, _, type_ = part[1:-1].partition(":")
+                if type_ not in ("", "d") or (name and not name.isidentifier()):
+                    raise ValueError(f"Unsupported field {part}")
+                if name in named_types:
+                    if named_types[name] != type_:
+                        raise ValueError(f"Field {name} is declared with different types")
+                    expression.append(f"(?P={name})")
+                    continue
+                field_pattern = _INT_PATTERN if type_ == "d" else ".+?"
+                if name:
+                    named_types[name] = type_
+                    expression.append(f"(?P<{name}>{field_pattern})")
+                    groups.append((name, _to_int if type_ == "d" else None))
+                else:
+                    expression.append(f"({field_pattern})")
+                    groups.append((sum(isinstance(key, int) for key, _ in groups), _to_int if type_ == "d" else None))
+            else:
+                expression.append(re.escape(part))
+        return re.compile("".join(expression), re.IGNORECASE | re.DOTALL), groups
+
+    def parse(self, text: str, convert: bool = True) -> Optional[FormatResult]:
+        """
+        Match the whole text with the format
+
+        :param text: The text to be parsed
+        :param convert: If the typed fields like ``{:d}`` should be converted. If not, they're left as str.
+            Formats falling back to ``parse.Parser`` always convert
+        :return: A dict containing the parsed fields, or None if the text doesn't match
+        """
+        if self.__parser is not None:
+            parsed: Optional[parse.Result] = self.__parser.parse(text)  # type: ignore
+            if parsed is None:
+                return None
+            result: FormatResult = dict(enumerate(parsed.fixed))
+            result.update(parsed.named)
+            return result
+
+        match = self.__pattern.fullmatch(text)
+        if match is None:
+            return None
+        if not convert:
+            return {key: value for (key, _), value in zip(self.__groups, match.groups())}
+        return {
+            key: value if converter is None else converter(value)
+            for (key, converter), value in zip(self.__groups, match.groups())
+        }
+
+    def __repr__(self):
+        return f"{type(self).__name__}[format={self.format!r}]"
+
+
+@functools.lru_cache(maxsize=None)
+def compile_format(format: str) -> CompiledFormat:
+    """
+    Return the :class:`CompiledFormat` of the given format string. The result is cached for reuse
+
+    :param format: A format string of ``parse.parse``
+    """
+    return CompiledFormat(format)
@@ -1,18 +1,21 @@
 import contextlib
-import json
+import functools
 import re
 from abc import ABC
-from typing import List, Optional
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
 
-import parse
+import orjson
 from mcdreforged.minecraft.rtext.text import RTextBase
 from mcdreforged.plugin.meta.version import VersionParsingError
 from mcdreforged.utils import string_util
 from mcdreforged.utils.types import MessageText
 
 from aiomcdr.app.handler.abstract_server_handler import AbstractServerHandler
+from aiomcdr.app.handler.compiled_format import CompiledFormat, compile_format
+from aiomcdr.app.handler.info_classifier import ProbeKind
 from aiomcdr.app.info_reactor.info import Info
 from aiomcdr.app.info_reactor.server_information import ServerInformation
+from aiomcdr.app.server_phase import ServerPhase
 
 
 class AbstractMinecraftHandler(AbstractServerHandler, ABC):
@@ -20,6 +23,30 @@ class AbstractMinecraftHandler(AbstractServerHandler, ABC):
     An abstract handler for Minecraft Java Edition servers
     """
 
+    __player_name_re = re.compile(r"\w+")
+    __player_joined_format = compile_format("{name}[{}] logged in with entity id {} at ({})")
+    __player_left_re = re.compile(r"\w{1,16} left the game")
+    __server_version_format = compile_format("Starting minecraft server version {version}")
+    __server_address_format = compile_format("Starting Minecraft server on {}:{:d}")
+    __startup_done_re = re.compile(r'Done \([0-9.]*s\)! For help, type "help"( or "\?")?')
+    __rcon_started_re = re.compile(r"RCON running on [\w.]+:\d+")
+    # the vanilla death messages, up to the part with the killer, the item or the escaping reason
+    __death_message_re = re.compile(
+        r"(\w{1,16}) (?:"
+        r"was (?:squashed|squished|shot|pricked to death|roasted in dragon's breath|killed|blown up|fireballed|"
+        r"frozen to death|struck by lightning|slain|burnt to a crisp|obliterated|impaled|stung to death|poked to death|"
+        r"pummeled|doomed to fall|skewered)\b|"
+        r"walked into |drowned(?: |$)|died(?: because |$)|blew up$|hit the ground too hard|went off with a bang|"
+        r"experienced kinetic energy|froze to death|discovered the floor was lava|went up in flames|"
+        r"suffocated in a wall|tried to swim in lava|burned to death|fell (?:from|off|out of|while|too far)\b|"
+        r"left the confines of this world|didn't want to live|starved to death|withered away"
+        r")"
+    )
+    __player_list_re = re.compile(r"There are \d+ of a max(?: of)? \d+ players online:(.*)", re.DOTALL)
+    __advancement_re = re.compile(
+        r"(\w{1,16}) has (?:made the advancement|completed the challenge|reached the goal) \[(.+)\]"
+    )
+
     def get_stop_command(self) -> str:
         return "stop"
 
@@ -39,12 +66,22 @@ class AbstractMinecraftHandler(AbstractServerHandler, ABC):
 
         If none of these formatter strings can be parsed successfully, then this info
         is considered as a non-player message, i.e. has :attr:`info.player <aiomcdr.info_reactor.info.Info.hour>` equaling None
+
+        The return value should be a constant value, since it's compiled only once per handler class
         """
         return [
             "<{name}> {message}",
             "[Not Secure] <{name}> {message}",  # since mc 1.19, when a player sends an un-verified chat message
         ]
 
+    @classmethod
+    @functools.lru_cache()
+    def _get_player_message_parsers(cls) -> List[CompiledFormat]:
+        """
+        The return value is cached for reuse. Do not modify
+        """
+        return list(map(compile_format, cls.get_player_message_parsing_formatter()))
+
     @classmethod
     def format_message(cls, message: MessageText) -> str:
         """
@@ -53,23 +90,39 @@ class AbstractMinecraftHandler(AbstractServerHandler, ABC):
         if isinstance(message, RTextBase):
             return message.to_json_str()
         else:
-            return json.dumps(str(message))
+            # same as the json.dumps(..., ensure_ascii=False) of RTextBase.to_json_str, but much faster
+            return orjson.dumps(str(message)).decode("utf8")
 
-    def get_send_message_command(
-        self, target: str, message: MessageText, server_information: ServerInformation
-    ) -> Optional[str]:
-        can_do_execute = False
-        if server_information.version is not None:
+    @classmethod
+    @functools.lru_cache()
+    def _get_send_message_command_prefix(cls, server_version: Optional[str]) -> str:
+        """
+        The part of the message sending command before the target, for the given server version
+
+        It's cached for each server version, a newly detected version simply gets its own one
+        """
+        if server_version is not None:
             with contextlib.suppress(VersionParsingError):
                 from mcdreforged.plugin.meta.version import Version
 
-                version = Version(server_information.version.split(" ")[0])
-                if version >= Version("1.13.0"):
-                    can_do_execute = True
-        command = f"tellraw {target} {self.format_message(message)}"
-        if can_do_execute:
-            command = f"execute at @p run {command}"
-        return command
+                if Version(server_version.split(" ")[0]) >= Version("1.13.0"):
+                    return "execute at @p run tellraw "
+        return "tellraw "
+
+    def get_send_message_command(
+        self, target: str, message: MessageText, server_information: ServerInformation
+    ) -> Optional[str]:
+        prefix = self._get_send_message_command_prefix(server_information.version)
+        return f"{prefix}{target} {self.format_message(message)}"
+
+    def get_send_message_commands(
+        self, targets: Iterable[str], message: MessageText, server_information: ServerInformation
+    ) -> List[str]:
+        # a target selector cannot match several names at once, so it's still a command for each player,
+        # but the message is only serialized once
+        prefix = self._get_send_message_command_prefix(server_information.version)
+        formatted = self.format_message(message)
+        return [f"{prefix}{target} {formatted}" for target in dict.fromkeys(targets)]
 
     def get_broadcast_message_command(
         self, message: MessageText, server_information: ServerInformation
@@ -86,22 +139,51 @@ class AbstractMinecraftHandler(AbstractServerHandler, ABC):
 
     @classmethod
     def _verify_player_name(cls, name: str):
-        return re.fullmatch(r"\w+", name) is not None
+        return cls.__player_name_re.fullmatch(name) is not None
 
-    def parse_server_stdout(self, text: str):
-        result = super().parse_server_stdout(text)
+    def try_parse_server_stdout(self, text: str) -> Optional[Info]:
+        result = super().try_parse_server_stdout(text)
+        if result is None:
+            return None
 
-        for formatter in self.get_player_message_parsing_formatter():
-            parsed: parse.Result = parse.parse(formatter, result.content)  # type: ignore
+        for parser in self._get_player_message_parsers():
+            parsed = parser.parse(result.content)  # type: ignore
             if parsed is not None and self._verify_player_name(parsed["name"]):
                 result.player, result.content = parsed["name"], parsed["message"]
                 break
         return result
 
+    @classmethod
+    def get_probe_prefixes(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {
+            ProbeKind.SERVER_STARTUP_DONE: ["Done ("],
+            ProbeKind.SERVER_VERSION: ["Starting minecraft server version "],
+            ProbeKind.SERVER_ADDRESS: ["Starting Minecraft server on "],
+            ProbeKind.RCON_STARTED: ["RCON running on "],
+            ProbeKind.SERVER_STOPPING: ["Stopping server"],
+        }
+
+    @classmethod
+    def get_probe_keywords(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {
+            ProbeKind.PLAYER_JOINED: ["] logged in with entity id "],
+            ProbeKind.PLAYER_LEFT: [" left the game"],
+            ProbeKind.PLAYER_MADE_ADVANCEMENT: [
+                " has made the advancement [",
+                " has completed the challenge [",
+                " has reached the goal [",
+            ],
+        }
+
+    @classmethod
+    def get_probe_phases(cls) -> Dict[ProbeKind, Collection[ServerPhase]]:
+        # the death messages have no literal to look for, and players can only die after the server has started
+        return {**super().get_probe_phases(), ProbeKind.DEATH_MESSAGE: [ServerPhase.RUNNING, ServerPhase.STOPPING]}
+
     def parse_player_joined(self, info: Info):
         # Steve[/127.0.0.1:9864] logged in with entity id 131 at (187.2703, 146.79014, 404.84718)
         if not info.is_user:
-            parsed: parse.Result = parse.parse("{name}[{}] logged in with entity id {} at ({})", info.content)  # type: ignore
+            parsed = self.__player_joined_format.parse(info.content)  # type: ignore
             if parsed is not None and self._verify_player_name(parsed["name"]):
                 return parsed["name"]
         return None
@@ -110,19 +192,19 @@ class AbstractMinecraftHandler(AbstractServerHandler, ABC):
         if info.content is None:
             return None
         # Steve left the game
-        if not info.is_user and re.fullmatch(r"\w{1,16} left the game", info.content):
+        if not info.is_user and self.__player_left_re.fullmatch(info.content):
             return info.content.split(" ")[0]
 
     def parse_server_version(self, info: Info):
         if not info.is_user:
-            parsed: parse.Result = parse.parse("Starting minecraft server version {version}", info.content)  # type: ignore
+            parsed = self.__server_version_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed["version"]
         return None
 
     def parse_server_address(self, info: Info):
         if not info.is_user:
-            parsed: parse.Result = parse.parse("Starting Minecraft server on {}:{:d}", info.content)  # type: ignore
+            parsed = self.__server_address_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed[0], parsed[1]
         return None
@@ -133,18 +215,41 @@ class AbstractMinecraftHandler(AbstractServerHandler, ABC):
             return None
         # 1.13+ Done (3.500s)! For help, type "help"
         # 1.13- Done (3.500s)! For help, type "help" or "?"
-        return (
-            info.is_from_server
-            and re.fullmatch(r'Done \([0-9.]*s\)! For help, type "help"( or "\?")?', info.content) is not None
-        )
+        return info.is_from_server and self.__startup_done_re.fullmatch(info.content) is not None
 
     def test_rcon_started(self, info: Info):
         # sourcery skip: no-conditionals-in-tests
         if info.content is None:
             return None
         # RCON running on 0.0.0.0:25575
-        return info.is_from_server and re.fullmatch(r"RCON running on [\w.]+:\d+", info.content) is not None
+        return info.is_from_server and self.__rcon_started_re.fullmatch(info.content) is not None
 
     def test_server_stopping(self, info: Info):
         # Stopping server
         return info.is_from_server and info.content == "Stopping server"
+
+    def parse_death_message(self, info: Info) -> Optional[str]:
+        # Steve was slain by Zombie
+        # Steve fell from a high place
+        if info.is_from_server and info.player is None and info.content is not None:
+            match = self.__death_message_re.match(info.content)
+            if match is not None:
+                return match.group(1)
+        return None
+
+    def parse_player_made_advancement(self, info: Info) -> Optional[Tuple[str, str]]:
+        # Steve has made the advancement [Stone Age]
+        # Steve has completed the challenge [Uneasy Alliance]
+        # Steve has reached the goal [Sky's the Limit]
+        if info.is_from_server and info.player is None and info.content is not None:
+            match = self.__advancement_re.fullmatch(info.content)
+            if match is not None:
+                return match.group(1), match.group(2)
+        return None
+
+    def parse_player_list(self, text: str) -> Optional[List[str]]:
+        # There are 2 of a max of 20 players online: Steve, Alex
+        match = self.__player_list_re.fullmatch(text.strip())
+        if match is None:
+            return None
+        return [name for name in (name.strip() for name in match.group(1).split(",")) if name]
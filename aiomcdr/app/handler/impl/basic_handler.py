@@ -1,11 +1,12 @@
 """
 The basic plain handler
 """
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 from mcdreforged.utils.types import MessageText
 
 from aiomcdr.app.handler.abstract_server_handler import AbstractServerHandler
+from aiomcdr.app.handler.info_classifier import ProbeKind
 from aiomcdr.app.info_reactor.info import Info
 from aiomcdr.app.info_reactor.server_information import ServerInformation
 
@@ -34,9 +35,13 @@ class BasicHandler(AbstractServerHandler):
     def get_content_parsing_formatter(cls):
         raise RuntimeError()
 
-    def parse_server_stdout(self, text: str) -> Info:
+    def try_parse_server_stdout(self, text: str) -> Optional[Info]:
         return self._get_server_stdout_raw_result(text)
 
+    @classmethod
+    def get_probe_prefixes(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {kind: [] for kind in ProbeKind}
+
     def parse_player_joined(self, info):
         return None
 
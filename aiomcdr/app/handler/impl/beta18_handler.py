@@ -1,12 +1,13 @@
 import re
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 
-import parse
 from mcdreforged.minecraft.rtext.text import RTextBase
 from mcdreforged.utils import string_util
 from mcdreforged.utils.types import MessageText
 
+from aiomcdr.app.handler.compiled_format import compile_format
 from aiomcdr.app.handler.impl.vanilla_handler import VanillaHandler
+from aiomcdr.app.handler.info_classifier import ProbeKind
 from aiomcdr.app.info_reactor.info import Info
 from aiomcdr.app.info_reactor.server_information import ServerInformation
 
@@ -16,6 +17,10 @@ class Beta18Handler(VanillaHandler):
     Yes, a handler for Minecraft beta 1.8
     """
 
+    __player_joined_format = compile_format("{name} [{}] logged in with entity id {} at ({})")
+    __player_left_format = compile_format("{name} lost connection: {}")
+    __startup_done_re = re.compile(r'Done \([0-9.]*ns\)! For help, type "help" or "\?"')
+
     @classmethod
     def format_message(cls, message: MessageText) -> str:
         if isinstance(message, RTextBase):
@@ -29,6 +34,12 @@ class Beta18Handler(VanillaHandler):
     ) -> Optional[str]:
         return f"tell {target} {self.format_message(message)}"
 
+    def get_send_message_commands(
+        self, targets: Iterable[str], message: MessageText, server_information: ServerInformation
+    ) -> List[str]:
+        formatted = self.format_message(message)
+        return [f"tell {target} {formatted}" for target in dict.fromkeys(targets)]
+
     def get_broadcast_message_command(
         self, message: MessageText, server_information: ServerInformation
     ) -> Optional[str]:
@@ -40,11 +51,24 @@ class Beta18Handler(VanillaHandler):
     def get_content_parsing_formatter(cls):
         return "{y:d}-{m:d}-{d:d} {hour:d}:{min:d}:{sec:d} [{logging}] {content}"
 
+    @classmethod
+    def get_probe_prefixes(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {**super().get_probe_prefixes(), ProbeKind.RCON_STARTED: []}
+
+    @classmethod
+    def get_probe_keywords(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {
+            ProbeKind.PLAYER_JOINED: ["] logged in with entity id "],
+            ProbeKind.PLAYER_LEFT: [" lost connection: "],
+            ProbeKind.DEATH_MESSAGE: [],
+            ProbeKind.PLAYER_MADE_ADVANCEMENT: [],
+        }
+
     def parse_player_joined(self, info):
         # Steve [/127.0.0.1:2993] logged in with entity id 3827 at (-130.5, 69.0, 253.5)
         if not info.is_user:
             # there's an extra space character after {name}
-            parsed: parse.Result = parse.parse("{name} [{}] logged in with entity id {} at ({})", info.content)  # type: ignore
+            parsed = self.__player_joined_format.parse(info.content)  # type: ignore
             if parsed is not None and self._verify_player_name(parsed["name"]):
                 return parsed["name"]
         return None
@@ -53,7 +77,7 @@ class Beta18Handler(VanillaHandler):
         if info.content is None:
             return None
         # Steve lost connection: disconnect.quitting
-        if info.is_from_server and parse.parse("{name} lost connection: {}", info.content) is not None:
+        if info.is_from_server and self.__player_left_format.parse(info.content) is not None:
             return info.content.split(" ")[0]
         return None
 
@@ -64,12 +88,18 @@ class Beta18Handler(VanillaHandler):
         # Done (6368115300ns)! For help, type "help" or "?"
         if info.is_user:
             return False
-        match = re.fullmatch(r'Done \([0-9.]*ns\)! For help, type "help" or "\?"', info.content)
+        match = self.__startup_done_re.fullmatch(info.content)
         return match is not None
 
     def test_rcon_started(self, info: Info):
         return False
 
+    def parse_death_message(self, info: Info):
+        return None
+
+    def parse_player_made_advancement(self, info: Info):
+        return None
+
     def test_server_stopping(self, info: Info):
         # Stopping server
         return not info.is_user and info.content == "Stopping server"
@@ -1,12 +1,14 @@
 import re
-from typing import Optional
+from typing import Collection, Dict, Iterable, Optional
 
-import parse
 from mcdreforged.utils.types import MessageText
 
 from aiomcdr.app.handler.abstract_server_handler import AbstractServerHandler
+from aiomcdr.app.handler.compiled_format import compile_format
+from aiomcdr.app.handler.info_classifier import ProbeKind
 from aiomcdr.app.info_reactor.info import Info
 from aiomcdr.app.info_reactor.server_information import ServerInformation
+from aiomcdr.app.server_phase import ServerPhase
 
 
 class BungeecordHandler(AbstractServerHandler):
@@ -14,6 +16,13 @@ class BungeecordHandler(AbstractServerHandler):
     A handler for `Bungeecord <https://github.com/SpigotMC/BungeeCord>`__ servers
     """
 
+    __prompt_re = re.compile(r">*\r")
+    __player_joined_format = compile_format("[{name},/{ip}] <-> InitialHandler has connected")
+    __player_left_format = compile_format("[{name}] -> UpstreamBridge has disconnected")
+    __server_address_format = compile_format("Listening on /{}:{:d}")
+    __startup_done_re = re.compile(r"Listening on /[0-9.]+:[0-9]+")
+    __server_stopping_re = re.compile(r"Closing listener \[id: .+, L:[\d:/]+]")
+
     def get_stop_command(self) -> str:
         return "end"
 
@@ -37,15 +46,38 @@ class BungeecordHandler(AbstractServerHandler):
 
     def pre_parse_server_stdout(self, text):
         text = super().pre_parse_server_stdout(text)
-        match = re.match(r">*\r", text)
+        match = self.__prompt_re.match(text)
         if match is not None:
             text = text.replace(match.group(), "", 1)
         return text
 
+    @classmethod
+    def get_probe_prefixes(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {
+            ProbeKind.SERVER_STARTUP_DONE: ["Listening on /"],
+            ProbeKind.SERVER_VERSION: [],
+            ProbeKind.SERVER_ADDRESS: ["Listening on /"],
+            ProbeKind.RCON_STARTED: ["Listening on /"],
+            ProbeKind.SERVER_STOPPING: ["Closing listener [id: "],
+        }
+
+    @classmethod
+    def get_probe_keywords(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {
+            **super().get_probe_keywords(),
+            ProbeKind.PLAYER_JOINED: ["] <-> InitialHandler has connected"],
+            ProbeKind.PLAYER_LEFT: ["] -> UpstreamBridge has disconnected"],
+        }
+
+    @classmethod
+    def get_probe_phases(cls) -> Dict[ProbeKind, Collection[ServerPhase]]:
+        # the rcon started message is the startup done message
+        return {**super().get_probe_phases(), ProbeKind.RCON_STARTED: [ServerPhase.STARTING]}
+
     def parse_player_joined(self, info: Info) -> Optional[str]:
         # [Steve,/127.0.0.1:3631] <-> InitialHandler has connected
         if not info.is_user:
-            parsed: parse.Result = parse.parse("[{name},/{ip}] <-> InitialHandler has connected", info.content)  # type: ignore
+            parsed = self.__player_joined_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed["name"]
         return None
@@ -53,7 +85,7 @@ class BungeecordHandler(AbstractServerHandler):
     def parse_player_left(self, info):
         # [Steve] -> UpstreamBridge has disconnected
         if not info.is_user:
-            parsed: parse.Result = parse.parse("[{name}] -> UpstreamBridge has disconnected", info.content)  # type: ignore
+            parsed = self.__player_left_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed["name"]
         return None
@@ -64,7 +96,7 @@ class BungeecordHandler(AbstractServerHandler):
     def parse_server_address(self, info: Info):
         # Listening on /0.0.0.0:25577
         if not info.is_user:
-            parsed: parse.Result = parse.parse("Listening on /{}:{:d}", info.content)  # type: ignore
+            parsed = self.__server_address_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed[0], parsed[1]
         return None
@@ -74,7 +106,7 @@ class BungeecordHandler(AbstractServerHandler):
         if info.content is None:
             return False
         # Listening on /0.0.0.0:25577
-        return (not info.is_user) and re.fullmatch(r"Listening on /[0-9.]+:[0-9]+", info.content) is not None
+        return (not info.is_user) and self.__startup_done_re.fullmatch(info.content) is not None
 
     def test_rcon_started(self, info: Info) -> bool:
         return self.test_server_startup_done(info)
@@ -84,4 +116,4 @@ class BungeecordHandler(AbstractServerHandler):
         if info.content is None:
             return False
         # Closing listener [id: 0x3acae0b0, L:/0:0:0:0:0:0:0:0:25565]
-        return (not info.is_user) and re.fullmatch(r"Closing listener \[id: .+, L:[\d:/]+]", info.content) is not None
+        return (not info.is_user) and self.__server_stopping_re.fullmatch(info.content) is not None
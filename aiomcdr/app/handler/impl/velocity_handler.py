@@ -1,10 +1,11 @@
 import re
-from typing import Iterable, Optional, Union
+from typing import Dict, Iterable, Optional, Union
 
-import parse
 from mcdreforged.utils.types import MessageText
 
 from aiomcdr.app.handler.abstract_server_handler import AbstractServerHandler
+from aiomcdr.app.handler.compiled_format import compile_format
+from aiomcdr.app.handler.info_classifier import ProbeKind
 from aiomcdr.app.info_reactor.info import Info
 from aiomcdr.app.info_reactor.server_information import ServerInformation
 
@@ -14,6 +15,11 @@ class VelocityHandler(AbstractServerHandler):
     A handler for `Velocity <https://velocitypowered.com>`__ servers
     """
 
+    __player_joined_format = compile_format("[connected player] {name} (/{address}) has connected")
+    __player_left_format = compile_format("[connected player] {name} (/{address}) has disconnected")
+    __server_address_format = compile_format("Listening on /{}:{:d}")
+    __startup_done_re = re.compile(r"Done \([0-9.]*s\)!")
+
     def get_stop_command(self) -> str:
         return "shutdown"
 
@@ -35,10 +41,22 @@ class VelocityHandler(AbstractServerHandler):
             "[{hour:d}:{min:d}:{sec:d} {logging}] {dummy}: {content}",  # something there is an extra element after the heading [] and :
         )
 
+    @classmethod
+    def get_probe_prefixes(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {
+            ProbeKind.SERVER_STARTUP_DONE: ["Done ("],
+            ProbeKind.SERVER_VERSION: [],
+            ProbeKind.SERVER_ADDRESS: ["Listening on /"],
+            ProbeKind.RCON_STARTED: [],
+            ProbeKind.SERVER_STOPPING: ["Shutting down the proxy..."],
+            ProbeKind.PLAYER_JOINED: ["[connected player] "],
+            ProbeKind.PLAYER_LEFT: ["[connected player] "],
+        }
+
     def parse_player_joined(self, info: Info) -> Optional[str]:
         # [connected player] Fallen_Breath (/127.0.0.1:12896) has connected
         if not info.is_user:
-            parsed: parse.Result = parse.parse("[connected player] {name} (/{address}) has connected", info.content)  # type: ignore
+            parsed = self.__player_joined_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed["name"]
         return None
@@ -46,7 +64,7 @@ class VelocityHandler(AbstractServerHandler):
     def parse_player_left(self, info: Info) -> Optional[str]:
         # [connected player] Fallen_Breath (/127.0.0.1:12896) has disconnected
         if not info.is_user:
-            parsed: parse.Result = parse.parse("[connected player] {name} (/{address}) has disconnected", info.content)  # type: ignore
+            parsed = self.__player_left_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed["name"]
         return None
@@ -59,7 +77,7 @@ class VelocityHandler(AbstractServerHandler):
         # Listening on /[0:0:0:0:0:0:0:0%0]:25577
         # Listening on /0:0:0:0:0:0:0:0%0:25577
         if not info.is_user:
-            parsed: parse.Result = parse.parse("Listening on /{}:{:d}", info.content)  # type: ignore
+            parsed = self.__server_address_format.parse(info.content)  # type: ignore
             if parsed is not None:
                 return parsed[0], parsed[1]
         return None
@@ -69,7 +87,7 @@ class VelocityHandler(AbstractServerHandler):
         if info.content is None:
             return False
         # Done (3.05s)!
-        return not info.is_user and re.fullmatch(r"Done \([0-9.]*s\)!", info.content) is not None
+        return not info.is_user and self.__startup_done_re.fullmatch(info.content) is not None
 
     def test_rcon_started(self, info: Info) -> bool:
         return False
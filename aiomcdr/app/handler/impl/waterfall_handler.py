@@ -1,9 +1,9 @@
-from typing import Optional
-
-from parse import parse
+from typing import Dict, Iterable, Optional
 
+from aiomcdr.app.handler.compiled_format import compile_format
 from aiomcdr.app.handler.impl.bukkit_handler import BukkitHandler
 from aiomcdr.app.handler.impl.bungeecord_handler import BungeecordHandler
+from aiomcdr.app.handler.info_classifier import ProbeKind
 from aiomcdr.app.info_reactor.info import Info
 
 
@@ -14,6 +14,8 @@ class WaterfallHandler(BungeecordHandler):
     The logging format of waterfall server is paper like (waterfall is PaperMC's bungeecord fork shmm)
     """
 
+    __player_left_format = compile_format("[/{ip}|{name}] -> UpstreamBridge has disconnected")
+
     # [02:18:30 INFO]: Enabled plugin cmd_list version git:cmd_list:1.15-SNAPSHOT:f1c32f8:1489 by SpigotMC
     # [02:18:29 INFO] [ViaVersion]: Loading 1.12.2 -> 1.13 mappings..."
     @classmethod
@@ -23,6 +25,10 @@ class WaterfallHandler(BungeecordHandler):
             "[{hour:d}:{min:d}:{sec:d} {logging}] {dummy}: {content}",  # something there is an extra element after the heading [] and :
         )
 
+    @classmethod
+    def get_probe_keywords(cls) -> Dict[ProbeKind, Iterable[str]]:
+        return {**super().get_probe_keywords(), ProbeKind.PLAYER_JOINED: []}
+
     def parse_player_joined(self, info: Info) -> Optional[str]:
         # [02:18:52 INFO]: [/127.0.0.1:14426] <-> InitialHandler has connected
         # sadly no player id display here
@@ -31,7 +37,7 @@ class WaterfallHandler(BungeecordHandler):
     def parse_player_left(self, info):
         # [/127.0.0.1:14426|Fallen_Breath] -> UpstreamBridge has disconnected
         if not info.is_user:
-            parsed = parse("[/{ip}|{name}] -> UpstreamBridge has disconnected", info.content)
+            parsed = self.__player_left_format.parse(info.content)
             if parsed is not None:
-                return parsed["name"]  # type: ignore
+                return parsed["name"]
         return None
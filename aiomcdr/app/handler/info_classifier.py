@@ -0,0 +1,183 @@
+"""
+Single-pass classification of infos with the probes of a server handler
+"""
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from aiomcdr.app.server_phase import ServerPhase
+
+if TYPE_CHECKING:
+    from aiomcdr.app.handler.abstract_server_handler import AbstractServerHandler
+    from aiomcdr.app.info_reactor.info import Info
+
+
+class ProbeKind(Enum):
+    """
+    Kinds of the probes of a server handler. The value is the field name in :class:`InfoClassification`
+    """
+
+    SERVER_STARTUP_DONE = "server_startup_done"
+    SERVER_VERSION = "server_version"
+    SERVER_ADDRESS = "server_address"
+    RCON_STARTED = "rcon_started"
+    SERVER_STOPPING = "server_stopping"
+    PLAYER_JOINED = "player_joined"
+    PLAYER_LEFT = "player_left"
+    DEATH_MESSAGE = "death_message"
+    PLAYER_MADE_ADVANCEMENT = "player_made_advancement"
+
+    @property
+    def method_name(self) -> str:
+        """
+        The name of the handler method that does the probing
+        """
+        return _PROBE_METHOD_NAMES[self]
+
+
+_PROBE_METHOD_NAMES = {
+    ProbeKind.SERVER_STARTUP_DONE: "test_server_startup_done",
+    ProbeKind.SERVER_VERSION: "parse_server_version",
+    ProbeKind.SERVER_ADDRESS: "parse_server_address",
+    ProbeKind.RCON_STARTED: "test_rcon_started",
+    ProbeKind.SERVER_STOPPING: "test_server_stopping",
+    ProbeKind.PLAYER_JOINED: "parse_player_joined",
+    ProbeKind.PLAYER_LEFT: "parse_player_left",
+    ProbeKind.DEATH_MESSAGE: "parse_death_message",
+    ProbeKind.PLAYER_MADE_ADVANCEMENT: "parse_player_made_advancement",
+}
+
+
+class InfoClassification(NamedTuple):
+    """
+    The result of :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.classify`
+    """
+
+    server_startup_done: bool = False
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.test_server_startup_done`"""
+    server_version: Optional[str] = None
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.parse_server_version`"""
+    server_address: Optional[Tuple[str, int]] = None
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.parse_server_address`"""
+    rcon_started: bool = False
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.test_rcon_started`"""
+    server_stopping: bool = False
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.test_server_stopping`"""
+    player_joined: Optional[str] = None
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.parse_player_joined`"""
+    player_left: Optional[str] = None
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.parse_player_left`"""
+    death_message: Optional[str] = None
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.parse_death_message`"""
+    player_made_advancement: Optional[Tuple[str, str]] = None
+    """See :meth:`~aiomcdr.app.handler.abstract_server_handler.AbstractServerHandler.parse_player_made_advancement`"""
+
+
+EMPTY_CLASSIFICATION = InfoClassification()
+
+
+class _ProbeTable:
+    def __init__(
+        self,
+        kinds: Collection[ProbeKind],
+        prefixes: Dict[ProbeKind, Iterable[str]],
+        keywords: Dict[ProbeKind, Iterable[str]],
+    ):
+        self.always: Tuple[ProbeKind, ...] = tuple(
+            kind for kind in kinds if kind not in prefixes and kind not in keywords
+        )
+        # first word of the prefix -> [(prefix, kind)]
+        self.prefix_index: Dict[str, List[Tuple[str, ProbeKind]]] = {}
+        # prefixes without a complete first word, e.g. "["
+        self.short_prefixes: List[Tuple[str, ProbeKind]] = []
+        self.keywords: List[Tuple[str, ProbeKind]] = []
+        for kind, literals in prefixes.items():
+            if kind not in kinds:
+                continue
+            for prefix in map(str.lower, literals):
+                first_word, space, _ = prefix.partition(" ")
+                if space:
+                    self.prefix_index.setdefault(first_word, []).append((prefix, kind))
+                else:
+                    self.short_prefixes.append((prefix, kind))
+        for kind, literals in keywords.items():
+            if kind in kinds:
+                self.keywords.extend((keyword, kind) for keyword in map(str.lower, literals))
+
+    def get_candidates(self, content: Optional[str]) -> Set[ProbeKind]:
+        candidates = set(self.always)
+        if not content:
+            return candidates
+        lowered = content.lower()
+        for prefix, kind in self.prefix_index.get(lowered.partition(" ")[0], ()):
+            if lowered.startswith(prefix):
+                candidates.add(kind)
+        for prefix, kind in self.short_prefixes:
+            if lowered.startswith(prefix):
+                candidates.add(kind)
+        for keyword, kind in self.keywords:
+            if keyword in lowered:
+                candidates.add(kind)
+        return candidates
+
+
+class InfoClassifier:
+    """
+    Picks the few probes that might accept an info from a dispatch table built from the literal prefixes and keywords
+    declared by a server handler, so an ordinary line costs one dict lookup and a few substring tests
+
+    Literals are compared case-insensitively. Probes that declare neither prefixes nor keywords are always invoked
+
+    Probes can also be limited to some server phases, e.g. the startup probes are useless once the server is running.
+    A dispatch table is built for each phase, so the skipped probes cost nothing
+    """
+
+    def __init__(
+        self,
+        prefixes: Dict[ProbeKind, Iterable[str]],
+        keywords: Dict[ProbeKind, Iterable[str]],
+        phases: Optional[Dict[ProbeKind, Collection[ServerPhase]]] = None,
+    ):
+        prefixes = {kind: tuple(literals) for kind, literals in prefixes.items()}
+        keywords = {kind: tuple(literals) for kind, literals in keywords.items()}
+        phases = phases or {}
+        self.__tables: Dict[Optional[ServerPhase], _ProbeTable] = {
+            None: _ProbeTable(set(ProbeKind), prefixes, keywords)
+        }
+        for phase in ServerPhase:
+            kinds = {kind for kind in ProbeKind if kind not in phases or phase in phases[kind]}
+            self.__tables[phase] = _ProbeTable(kinds, prefixes, keywords)
+
+    def get_candidates(self, content: Optional[str], phase: Optional[ServerPhase] = None) -> Set[ProbeKind]:
+        """
+        Return the kinds of the probes that might accept the given content
+
+        :param content: The content of an info
+        :param phase: The current phase of the server. None to ignore the phase limits of the probes
+        """
+        return self.__tables[phase].get_candidates(content)
+
+    def classify(
+        self, handler: "AbstractServerHandler", info: "Info", phase: Optional[ServerPhase] = None
+    ) -> InfoClassification:
+        """
+        Run the candidate probes of the handler on the info
+        """
+        candidates = self.get_candidates(info.content, phase)
+        if not candidates:
+            return EMPTY_CLASSIFICATION
+        results = {}
+        for kind in candidates:
+            value = getattr(handler, kind.method_name)(info)
+            if value is not None and value is not False:
+                results[kind.value] = value
+        return InfoClassification(**results) if results else EMPTY_CLASSIFICATION
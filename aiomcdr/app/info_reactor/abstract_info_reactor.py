@@ -1,10 +1,14 @@
+import asyncio
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Collection, Iterable, Optional, Type
 
+from ..server_phase import ServerPhase
 from .info import Info
 
 if TYPE_CHECKING:
     from graia.broadcast import Broadcast
+    from graia.broadcast.entities.event import Dispatchable
+    from graia.broadcast.entities.listener import Listener
 
     from ..server import MinecraftServer
 
@@ -16,6 +20,19 @@ class AbstractInfoReactor(ABC):
 
     bcc: "Broadcast"
     server: "MinecraftServer"
+    phases: Optional[Collection[ServerPhase]] = None
+    """The server phases in which the reactor reacts to infos. None for every phase"""
+    dependencies: Optional[Collection[Type["AbstractInfoReactor"]]] = None
+    """
+    The reactor classes that have to finish reacting to an info before this reactor reacts to it.
+    If declared, the reactor reacts in its own task, concurrently with the reactors it does not depend on.
+    None to wait for all the non-pure reactors registered before this one, i.e. the registration order
+    """
+    pure: bool = False
+    """
+    If the reactor does not change the server state or the info, e.g. it only posts events.
+    A pure reactor reacts in its own task, and no reactor waits for it unless it is listed in the dependencies
+    """
 
     def __init__(self, bcc: "Broadcast", server: "MinecraftServer"):
         self.bcc: "Broadcast" = bcc
@@ -32,6 +49,32 @@ class AbstractInfoReactor(ABC):
         """
         raise NotImplementedError()
 
+    def has_listeners(self, event_class: Type["Dispatchable"]) -> bool:
+        """
+        If anyone listens to the given event class. Skip creating and posting the event if not
+
+        :param event_class: The class of the event to be posted
+        """
+        return self.server.reactor_manager.subscriptions.has_listeners(event_class)
+
+    def post_event(self, event: "Dispatchable") -> asyncio.Task:
+        """
+        Post an event to its listeners in the background, recording the latency of the listeners
+
+        :param event: The event to be posted
+        """
+        return self.server.reactor_manager.post_event(event)
+
+    async def dispatch_event(self, event: "Dispatchable", listeners: Optional[Iterable["Listener"]] = None):
+        """
+        Invoke the listeners of an event reacted from the info. Waits for them to finish,
+        unless the listener dispatch mode is detach
+
+        :param event: The event to be dispatched
+        :param listeners: The listeners to invoke. None for all the listeners of the event
+        """
+        await self.server.reactor_manager.dispatch_event(event, listeners)
+
     def on_server_start(self):
         """
         Gets invoked when the server starts
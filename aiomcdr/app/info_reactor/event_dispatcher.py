@@ -0,0 +1,123 @@
+"""
+Invoking the listeners of the events posted by aiomcdr, keeping a slow or failing plugin away from the others
+"""
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from graia.broadcast import Broadcast
+from graia.broadcast.entities.event import Dispatchable
+from graia.broadcast.entities.listener import Listener
+from graia.broadcast.exceptions import ExecutionStop, PropagationCancelled
+from graia.broadcast.utilles import dispatcher_mixin_handler, group_dict
+from loguru import logger
+
+from .listener_metrics import ListenerMetrics, get_listener_name, get_listener_plugin
+
+
+class EventDispatcher:
+    """
+    Invokes the listeners of an event like ``Broadcast.layered_scheduler`` does, each listener in its own task
+
+    - A listener running longer than the timeout is cancelled and reported
+    - Each plugin module runs at most ``plugin_concurrency`` listeners at the same time, the others wait for a free slot
+    - An exception in a listener is reported by the broadcast as usual, and never reaches the caller
+    - The latency of each call is recorded in :attr:`metrics`
+
+    Notes that a listener blocking the event loop, e.g. with a synchronous file read, cannot be interrupted,
+    it can only be spotted by its latency
+    """
+
+    def __init__(self, bcc: Broadcast, metrics: ListenerMetrics, timeout: float = 0, plugin_concurrency: int = 0):
+        """
+        :param bcc: The broadcast to execute the listeners with
+        :param metrics: Where to record the latency of the listeners
+        :param timeout: The seconds a listener may run before it's cancelled. 0 for no limit
+        :param plugin_concurrency: The maximum number of listeners of a plugin module running at the same time.
+            0 for no limit
+        """
+        self.bcc = bcc
+        self.metrics = metrics
+        self.timeout = timeout
+        self.plugin_concurrency = plugin_concurrency
+        self.__semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.__background_tasks: Set[asyncio.Task] = set()
+
+    def __get_semaphore(self, listener: Listener) -> Optional[asyncio.Semaphore]:
+        if self.plugin_concurrency <= 0:
+            return None
+        plugin = get_listener_plugin(listener)
+        semaphore = self.__semaphores.get(plugin)
+        if semaphore is None:
+            semaphore = self.__semaphores[plugin] = asyncio.Semaphore(self.plugin_concurrency)
+        return semaphore
+
+    async def __execute(self, listener: Listener, event: Dispatchable, dispatchers: list):
+        semaphore = self.__get_semaphore(listener)
+        if semaphore is not None:
+            await semaphore.acquire()
+        start = time.perf_counter()
+        called = True
+        try:
+            await asyncio.wait_for(
+                self.bcc.Executor(target=listener, dispatchers=dispatchers), self.timeout if self.timeout > 0 else None
+            )
+        except ExecutionStop:  # filtered out, not a real call
+            called = False
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(f"监听器 {get_listener_name(listener)} 处理 {type(event).__name__} 超过 {self.timeout}s 未完成，已取消")
+        except PropagationCancelled:
+            raise
+        except Exception:  # already reported by the broadcast
+            pass
+        finally:
+            if called:
+                self.metrics.record(listener, event, time.perf_counter() - start)
+            if semaphore is not None:
+                semaphore.release()
+
+    async def run(self, listeners: Iterable[Listener], event: Dispatchable):
+        """
+        Invoke the listeners with the event and wait for them, the same as ``Broadcast.layered_scheduler``
+        """
+        grouped: Dict[int, List[Listener]] = group_dict(
+            listeners, lambda x: x.priorities.get(event.__class__) or x.priority
+        )
+        dispatchers = dispatcher_mixin_handler(event.Dispatcher)
+        with self.bcc.event_ctx.use(event):
+            for _, current_group in sorted(grouped.items(), key=lambda x: x[0]):
+                tasks = [asyncio.create_task(self.__execute(i, event, dispatchers)) for i in current_group]
+                try:
+                    done_tasks, _ = await asyncio.wait(tasks)
+                except asyncio.CancelledError:
+                    for task in tasks:
+                        task.cancel()
+                    raise
+                for task in done_tasks:
+                    if task.exception().__class__ is PropagationCancelled:
+                        return
+
+    def post(self, listeners: Iterable[Listener], event: Dispatchable) -> asyncio.Task:
+        """
+        Invoke the listeners with the event in a background task, like ``Broadcast.postEvent``
+        """
+        task = self.bcc.loop.create_task(self.run(listeners, event))
+        self.__background_tasks.add(task)
+        task.add_done_callback(self.__background_tasks.discard)
+        return task
+
+    async def join(self, timeout: Optional[float] = None):
+        """
+        Wait for the background tasks to finish, and cancel those still running after the timeout
+
+        :param timeout: The maximum seconds to wait. None for no limit
+        """
+        if not self.__background_tasks:
+            return
+        _, pending = await asyncio.wait(set(self.__background_tasks), timeout=timeout)
+        if pending:
+            logger.warning(f"仍有 {len(pending)} 个事件的监听器在 {timeout}s 内未完成，已取消")
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
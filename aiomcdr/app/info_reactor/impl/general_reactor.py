@@ -15,13 +15,21 @@ class GeneralReactor(AbstractInfoReactor):
         # if info.content is not None and info.is_from_console:
         #     await self.server.server_interface.execute(info.content)
 
+        # only the listeners whose info filters match the info are invoked
+        subscriptions = self.server.reactor_manager.subscriptions
+        info_listeners = subscriptions.get_info_listener_index(InfoEvent).get_listeners(info)
+        user_info_listeners = (
+            subscriptions.get_info_listener_index(UserInfoEvent).get_listeners(info) if info.is_user else []
+        )
+        if not info_listeners and not user_info_listeners:
+            return
+
         command_source = info.get_command_source()
 
-        # TODO: bcc.postEvent('')
         # self.server.plugin_manager.dispatch_event(MCDRPluginEvents.GENERAL_INFO, (info,))
-        await self.bcc.postEvent(InfoEvent(self.server, info, command_source))
+        if info_listeners:
+            await self.dispatch_event(InfoEvent(self.server, info, command_source), info_listeners)
 
-        # TODO: bcc.postEvent('')
-        if info.is_user:
+        if user_info_listeners:
             # self.server.plugin_manager.dispatch_event(MCDRPluginEvents.USER_INFO, (info,))
-            await self.bcc.postEvent(UserInfoEvent(self.server, info, command_source))
+            await self.dispatch_event(UserInfoEvent(self.server, info, command_source), user_info_listeners)
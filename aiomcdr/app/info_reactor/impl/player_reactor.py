@@ -5,41 +5,60 @@ from loguru import logger
 
 from aiomcdr.app.info_reactor.abstract_info_reactor import AbstractInfoReactor
 from aiomcdr.app.info_reactor.info import Info, InfoSource
-from aiomcdr.event.player import PlayerJoinedEvent, PlayerLeftEvent
+from aiomcdr.event.player import (
+    PlayerAdvancementEvent,
+    PlayerChatEvent,
+    PlayerDeathEvent,
+    PlayerJoinedEvent,
+    PlayerLeftEvent,
+)
 
 # from mcdreforged.plugin.plugin_event import MCDRPluginEvents
 # from mcdreforged.utils.logger import DebugOption
 
 
 class PlayerReactor(AbstractInfoReactor):
+    def on_server_stop(self):
+        self.server.online_players.clear()
+
     async def react(self, info: Info):
         if info.source == InfoSource.SERVER:
-            handler = self.server.handler
+            classification = self.server.handler.classify(info, self.server.phase)
 
             # on_player_joined
-            player = handler.parse_player_joined(info)
+            player = classification.player_joined
             if player is not None:
                 logger.debug("Player joined detected")
+                self.server.online_players.add(player)
                 self.server.permission_manager.touch_player(player)
                 # self.server.plugin_manager.dispatch_event(MCDRPluginEvents.PLAYER_JOINED, (player, info))
-                await self.bcc.postEvent(PlayerJoinedEvent(self.server, player, info))
+                if self.has_listeners(PlayerJoinedEvent):
+                    await self.dispatch_event(PlayerJoinedEvent(self.server, player, info))
 
             # on_player_left
-            player = handler.parse_player_left(info)
+            player = classification.player_left
             if player is not None:
                 logger.debug("Player left detected")
+                self.server.online_players.remove(player)
                 # self.server.plugin_manager.dispatch_event(MCDRPluginEvents.PLAYER_LEFT, (player,))
-                await self.bcc.postEvent(PlayerLeftEvent(self.server, player, info))
-
-            # 原来就已经注释了
-            # # on_death_message
-            # if handler.parse_death_message(info):
-            #     logger.debug('Death message detected')
-            #     self.server.plugin_manager.call('on_death_message', (self.server.server_interface, info.content))
-            #
-            # # on_player_made_advancement
-            # result = handler.parse_player_made_advancement(info)
-            # if result is not None:
-            #     logger.debug('Player made advancement detected')
-            #     player, advancement = result
-            #     self.server.plugin_manager.call('on_player_made_advancement', (self.server.server_interface, player, advancement))
+                if self.has_listeners(PlayerLeftEvent):
+                    await self.dispatch_event(PlayerLeftEvent(self.server, player, info))
+
+            # on_player_chat
+            if info.is_player and self.has_listeners(PlayerChatEvent):
+                await self.dispatch_event(PlayerChatEvent(self.server, info.player, info))  # type: ignore
+
+            # on_death_message
+            player = classification.death_message
+            if player is not None:
+                logger.debug("Death message detected")
+                if self.has_listeners(PlayerDeathEvent):
+                    await self.dispatch_event(PlayerDeathEvent(self.server, player, info))
+
+            # on_player_made_advancement
+            result = classification.player_made_advancement
+            if result is not None:
+                logger.debug("Player made advancement detected")
+                player, advancement = result
+                if self.has_listeners(PlayerAdvancementEvent):
+                    await self.dispatch_event(PlayerAdvancementEvent(self.server, player, info, advancement))
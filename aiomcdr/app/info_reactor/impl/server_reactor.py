@@ -7,7 +7,9 @@ from loguru import logger
 from aiomcdr.app.info_reactor.abstract_info_reactor import AbstractInfoReactor
 from aiomcdr.app.info_reactor.info import Info, InfoSource
 from aiomcdr.app.info_reactor.server_information import ServerInformation
+from aiomcdr.app.server_phase import ServerPhase
 from aiomcdr.event.lifetime import ApplicationLaunched
+from aiomcdr.event.server import RconStartedEvent, ServerStoppingEvent
 
 # from mcdreforged.mcdr_state import MCDReforgedFlag
 # from mcdreforged.plugin.plugin_event import MCDRPluginEvents
@@ -25,29 +27,35 @@ class ServerReactor(AbstractInfoReactor):
     async def react(self, info: Info):
         if info.source != InfoSource.SERVER:
             return
-        handler = self.server.handler
+        classification = self.server.handler.classify(info, self.server.phase)
 
-        if handler.test_server_startup_done(info):
+        # the startup probes are skipped from now on, until the server starts again
+        if classification.server_startup_done and self.server.set_phase(ServerPhase.RUNNING):
             logger.debug("Server startup detected")
             # self.server.add_flag(MCDReforgedFlag.SERVER_STARTUP)
             # self.server.plugin_manager.dispatch_event(MCDRPluginEvents.SERVER_STARTUP, ())
-            self.bcc.postEvent(ApplicationLaunched(self.server))
+            self.post_event(ApplicationLaunched(self.server))
 
-        version = handler.parse_server_version(info)
+        version = classification.server_version
         if version is not None:
             logger.debug(f"Server version detected: {version}")
             self.server_info.version = version
 
-        ip_and_port = handler.parse_server_address(info)
+        ip_and_port = classification.server_address
         if ip_and_port is not None:
             logger.debug("Server ip detected: {}:{}".format(*ip_and_port))
             self.server_info.ip, self.server_info.port = ip_and_port
 
-        # if handler.test_rcon_started(info):
-        #     logger.debug('Server rcon started detected')
-        #     self.server.add_flag(MCDReforgedFlag.SERVER_RCON_READY)
-        #     self.server.connect_rcon()
-
-        # if handler.test_server_stopping(info):  # notes that it might happen more than once in the server lifecycle
-        #     logger.debug('Server stopping detected')
-        #     self.server.rcon_manager.disconnect()
+        if classification.rcon_started:
+            logger.debug("Server rcon started detected")
+            # self.server.add_flag(MCDReforgedFlag.SERVER_RCON_READY)
+            self.server.connect_rcon()
+            if self.has_listeners(RconStartedEvent):
+                self.post_event(RconStartedEvent(self.server, info))
+
+        # notes that it might happen more than once in the server lifecycle
+        if classification.server_stopping and self.server.set_phase(ServerPhase.STOPPING):
+            logger.debug("Server stopping detected")
+            self.server.disconnect_rcon()
+            if self.has_listeners(ServerStoppingEvent):
+                self.post_event(ServerStoppingEvent(self.server, info))
@@ -1,8 +1,10 @@
 """
 Info and InfoSource
 """
+import contextlib
+import itertools
 from enum import Enum
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from mcdreforged.utils.exception import IllegalCallError, IllegalStateError
 
@@ -29,21 +31,40 @@ class InfoSource(int, Enum):
     """From input from console"""
 
 
+_DEFERRABLE_FIELDS = frozenset({"hour", "min", "sec", "logging_level"})
+
+
 class Info:
     """
     An :class:`Info` instance contains the parsed result from the server or from the console
     """
 
-    __id_counter = 0
+    __slots__ = (
+        "id",
+        "server",
+        "hour",
+        "min",
+        "sec",
+        "raw_content",
+        "content",
+        "player",
+        "source",
+        "logging_level",
+        "__send_to_server",
+        "__command_source",
+        "__field_resolver",
+    )
+
+    __id_counter = itertools.count()
 
     def __init__(self, source: InfoSource, raw_content: str):
-        self.id: int = Info.__id_counter
+        self.id: int = next(Info.__id_counter)
         """A monotonously increasing unique id"""
 
-        Info.__id_counter += 1
         self.server: Optional["MinecraftServer"] = None
         self.__send_to_server = True
         self.__command_source = None
+        self.__field_resolver: Optional[Callable[["Info"], None]] = None
 
         # -----------------
         #   Public fields
@@ -124,6 +145,41 @@ class Info:
     #      API
     # --------------
 
+    def defer_fields(self, resolver: Callable[["Info"], None]):
+        """
+        **Not public API**
+
+        Leave :attr:`hour`, :attr:`min`, :attr:`sec` and :attr:`logging_level` unset,
+        the resolver is invoked to fill them when any of them is accessed for the first time
+
+        :meta private:
+        """
+        try:
+            del self.hour, self.min, self.sec, self.logging_level
+        except AttributeError:  # some of them are already unset
+            for name in _DEFERRABLE_FIELDS:
+                with contextlib.suppress(AttributeError):
+                    delattr(self, name)
+        self.__field_resolver = resolver
+
+    def __getattr__(self, name: str):
+        # only invoked when a slot is unset, i.e. a deferred field is accessed for the first time
+        if name in _DEFERRABLE_FIELDS:
+            resolver = self.__field_resolver
+            if resolver is not None:
+                self.__field_resolver = None
+                assigned = {}  # fields assigned after deferring win over the resolved values
+                for field_name in _DEFERRABLE_FIELDS:
+                    try:
+                        assigned[field_name] = object.__getattribute__(self, field_name)
+                    except AttributeError:
+                        setattr(self, field_name, None)
+                resolver(self)
+                for field_name, value in assigned.items():
+                    setattr(self, field_name, value)
+                return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     def __assert_attached(self):
         if self.server is None:
             raise IllegalStateError("MCDR server is not attached to this Info instance yet")
@@ -0,0 +1,69 @@
+"""
+Picking the info event listeners to invoke by their info filters
+"""
+from typing import Dict, Iterable, List, Tuple
+
+from graia.broadcast.entities.listener import Listener
+
+from aiomcdr.event.info import InfoFilter
+
+from .info import Info
+
+
+class InfoListenerIndex:
+    """
+    An index of the listeners of an info event, built from the :class:`~aiomcdr.event.info.InfoFilter` they declare
+
+    Listeners with a prefix filter are indexed by the first word of the prefix, so picking the ones for an info costs
+    one dict lookup no matter how many of them there are. Only the picked listeners have their filters checked.
+    Listeners without any filter are always picked
+    """
+
+    def __init__(self, listeners: Iterable[Listener]):
+        self.unfiltered: List[Listener] = []
+        # first word of the prefix -> [(prefix, listener)]
+        self.prefix_index: Dict[str, List[Tuple[str, Listener]]] = {}
+        # prefixes without a complete first word, e.g. "["
+        self.short_prefixes: List[Tuple[str, Listener]] = []
+        # listeners filtering with no prefix, e.g. with a regex only
+        self.unindexed: List[Listener] = []
+        self.filters: Dict[Listener, List[InfoFilter]] = {}
+        for listener in listeners:
+            filters = [dispatcher for dispatcher in listener.dispatchers if isinstance(dispatcher, InfoFilter)]
+            if not filters:
+                self.unfiltered.append(listener)
+                continue
+            self.filters[listener] = filters
+            prefixes = next((info_filter.prefixes for info_filter in filters if info_filter.prefixes), ())
+            if not prefixes:
+                self.unindexed.append(listener)
+            for prefix in prefixes:
+                first_word, space, _ = prefix.partition(" ")
+                if space:
+                    self.prefix_index.setdefault(first_word, []).append((prefix, listener))
+                else:
+                    self.short_prefixes.append((prefix, listener))
+
+    def get_listeners(self, info: Info) -> List[Listener]:
+        """
+        Return the listeners whose filters match the info
+        """
+        if not self.filters:
+            return self.unfiltered
+        candidates: Dict[Listener, None] = dict.fromkeys(self.unindexed)
+        content = info.content
+        if content:
+            for prefix, listener in self.prefix_index.get(content.partition(" ")[0], ()):
+                if content.startswith(prefix):
+                    candidates[listener] = None
+            for prefix, listener in self.short_prefixes:
+                if content.startswith(prefix):
+                    candidates[listener] = None
+        if not candidates:
+            return self.unfiltered
+        matched = [
+            listener
+            for listener in candidates
+            if all(info_filter.match(info) for info_filter in self.filters[listener])
+        ]
+        return self.unfiltered + matched if matched else self.unfiltered
@@ -0,0 +1,143 @@
+"""
+The queue between the server stdout reader and the info reactors
+"""
+import asyncio
+from collections import deque
+from typing import Callable, Deque, Literal, Union
+
+from .info import Info
+
+T_OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
+
+
+class QueueMarker:
+    """
+    A callback put into the normal lane of the queue, it's called once all the infos put before it are processed
+
+    It's for the state changes the infos are reacted with, e.g. the lifecycle phase of the server,
+    so an info is always reacted to with the state from the time it's put into the queue
+    """
+
+    __slots__ = ("callback",)
+
+    def __init__(self, callback: Callable[[], None]):
+        self.callback = callback
+
+
+class InfoQueue:
+    """
+    A bounded info queue with a separated high-priority lane for user infos
+
+    Infos from users (see :attr:`Info.is_user <aiomcdr.app.info_reactor.info.Info.is_user>`) go into the priority lane,
+    which is unbounded and always consumed first, so chat commands never wait behind log spam.
+    Other infos go into the normal lane, which holds at most ``maxsize`` infos.
+    A :class:`QueueMarker` also goes into the normal lane, it does not count in ``maxsize`` and is never dropped
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        """The capacity of the normal lane. Zero or negative means unlimited"""
+        self.__user_infos: Deque[Info] = deque()
+        self.__infos: Deque[Union[Info, QueueMarker]] = deque()
+        self.__marker_count = 0
+        self.__not_empty = asyncio.Event()
+        self.__not_full = asyncio.Event()
+        self.__unfinished = 0
+        self.__finished = asyncio.Event()
+        self.__finished.set()
+
+    def qsize(self) -> int:
+        return len(self.__user_infos) + len(self.__infos)
+
+    def empty(self) -> bool:
+        return not self.__user_infos and not self.__infos
+
+    def full(self) -> bool:
+        """
+        If the normal lane is full. The priority lane is never full
+        """
+        return 0 < self.maxsize <= len(self.__infos) - self.__marker_count
+
+    def __append(self, info: Union[Info, QueueMarker]):
+        if isinstance(info, QueueMarker):
+            self.__infos.append(info)
+            self.__marker_count += 1
+        elif info.is_user:
+            self.__user_infos.append(info)
+        else:
+            self.__infos.append(info)
+        self.__unfinished += 1
+        self.__finished.clear()
+        self.__not_empty.set()
+
+    def put_nowait(self, info: Info):
+        """
+        Put an info into the queue without blocking
+
+        :raise asyncio.QueueFull: If the info is not from a user and the normal lane is full
+        """
+        if not info.is_user and self.full():
+            raise asyncio.QueueFull()
+        self.__append(info)
+
+    async def put(self, info: Info):
+        """
+        Put an info into the queue, wait until there's a free slot if the normal lane is full
+        """
+        while not info.is_user and self.full():
+            self.__not_full.clear()
+            await self.__not_full.wait()
+        self.__append(info)
+
+    def put_marker(self, marker: QueueMarker):
+        """
+        Put a marker into the normal lane, after all the infos in it. It never blocks
+        """
+        self.__append(marker)
+
+    def drop_oldest(self) -> bool:
+        """
+        Discard the oldest info in the normal lane
+
+        :return: If an info is discarded
+        """
+        for index, info in enumerate(self.__infos):
+            if not isinstance(info, QueueMarker):
+                del self.__infos[index]
+                self.task_done()
+                self.__not_full.set()
+                return True
+        return False
+
+    async def get(self) -> Union[Info, QueueMarker]:
+        """
+        Remove and return an info or a marker from the queue, user infos first.
+        Wait until an info is available if it's empty
+        """
+        while self.empty():
+            self.__not_empty.clear()
+            await self.__not_empty.wait()
+        if self.__user_infos:
+            return self.__user_infos.popleft()
+        info = self.__infos.popleft()
+        if isinstance(info, QueueMarker):
+            self.__marker_count -= 1
+        else:
+            self.__not_full.set()
+        return info
+
+    def task_done(self):
+        """
+        Indicate that a formerly enqueued info is processed
+        """
+        if self.__unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self.__unfinished -= 1
+        if self.__unfinished == 0:
+            self.__finished.set()
+
+    async def join(self):
+        """
+        Wait until every info in the queue is processed
+        """
+        await self.__finished.wait()
@@ -1,20 +1,34 @@
 """
 The place to reacting information from the server
 """
-from typing import TYPE_CHECKING, List, Optional
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
 
 from graia.broadcast import Broadcast
+from graia.broadcast.entities.event import Dispatchable
+from graia.broadcast.entities.listener import Listener
 from loguru import logger
 from mcdreforged.utils import class_util
 
 from aiomcdr.app.info_reactor.impl import GeneralReactor, PlayerReactor, ServerReactor
+from aiomcdr.event.info import InfoBatchEvent
 
 from .abstract_info_reactor import AbstractInfoReactor
+from .event_dispatcher import EventDispatcher
 from .info import Info
+from .info_queue import InfoQueue, QueueMarker
+from .listener_metrics import ListenerMetrics
+from .reactor_schedule import ReactorSchedule, ReactorTiming
+from .response_waiter_table import ResponseWaiterTable
+from .subscription_registry import SubscriptionRegistry
 
 if TYPE_CHECKING:
     from ..server import MinecraftServer
 
+QUEUE_FULL_WARN_INTERVAL_SEC = 5
+
 
 class InfoReactorManager:
     def __init__(self, bcc: "Broadcast", server: "MinecraftServer"):
@@ -22,6 +36,18 @@ class InfoReactorManager:
         self.server = server
         self.last_queue_full_warn_time = None
         self.reactors = []  # type: List[AbstractInfoReactor]
+        self.__schedule = ReactorSchedule([])
+        self.__timings: Dict[AbstractInfoReactor, ReactorTiming] = {}
+        self.info_queue = InfoQueue(server.config.info_queue_size)
+        self.subscriptions = SubscriptionRegistry(bcc)
+        self.listener_metrics = ListenerMetrics(server.config.listener_latency_budget)
+        self.event_dispatcher = EventDispatcher(
+            bcc, self.listener_metrics, server.config.listener_timeout, server.config.plugin_listener_concurrency
+        )
+        self.response_waiters = ResponseWaiterTable()
+        self.__process_task: Optional[asyncio.Task] = None
+        self.__info_batch: List[Info] = []
+        self.__info_batch_timer: Optional[asyncio.TimerHandle] = None
 
     def register_reactors(self, custom_reactor_class_paths: Optional[List[str]] = None):
         self.reactors.clear()
@@ -47,38 +73,166 @@ class InfoReactorManager:
                             f'Wrong reactor class "{class_path}", '
                             f"expected {AbstractInfoReactor} but found {reactor_class}"
                         )
+        self.__update_schedule()
+
+    def __update_schedule(self):
+        self.__schedule = ReactorSchedule(self.reactors)
+        self.__timings = {reactor: self.__timings.get(reactor) or ReactorTiming() for reactor in self.reactors}
+        logger.debug(f"信息反应器执行顺序: {self.__schedule.describe()}")
+
+    def get_reactor_timings(self) -> Dict[str, ReactorTiming]:
+        """
+        Return the time each registered reactor spent reacting to infos, keyed by the reactor class name
+        """
+        return {
+            type(reactor).__name__: self.__timings[reactor] for reactor in self.reactors if reactor in self.__timings
+        }
+
+    def reset_reactor_timings(self):
+        for reactor in self.__timings:
+            self.__timings[reactor] = ReactorTiming()
+
+    async def __react(self, reactor: AbstractInfoReactor, info: Info):
+        start = time.perf_counter()
+        try:
+            await reactor.react(info)
+        except Exception:
+            logger.exception("info_reactor_manager.react.error", type(reactor).__name__)
+        finally:
+            self.__timings[reactor].record(time.perf_counter() - start)
 
     async def process_info(self, info: Info):
-        for reactor in self.reactors:
-            try:
-                await reactor.react(info)
-            except Exception:
-                logger.exception("info_reactor_manager.react.error", type(reactor).__name__)
+        if len(self.__schedule.reactors) != len(self.reactors) or any(
+            a is not b for a, b in zip(self.__schedule.reactors, self.reactors)
+        ):
+            self.__update_schedule()
+        await self.__schedule.react(info, self.server.phase, self.__react)
 
         # send command input from the console to the server's stdin
         if info.is_from_console and info.should_send_to_server() and info.content:
             await self.server.send(info.content)
 
+        if self.subscriptions.has_listeners(InfoBatchEvent):
+            self.__add_to_batch(info)
+
+    async def dispatch_event(self, event: Dispatchable, listeners: Optional[Iterable[Listener]] = None):
+        """
+        Invoke the listeners of an event reacted from an info. Waits for them to finish,
+        unless the listener dispatch mode is detach
+
+        :param event: The event to be dispatched
+        :param listeners: The listeners to invoke. None for all the listeners of the event
+        """
+        if listeners is None:
+            listeners = self.subscriptions.get_listeners(event.__class__)
+        if self.server.config.listener_dispatch_mode == "detach":
+            self.event_dispatcher.post(listeners, event)
+        else:
+            await self.event_dispatcher.run(listeners, event)
+
+    def post_event(self, event: Dispatchable) -> asyncio.Task:
+        """
+        Invoke the listeners of the event in a background task like ``Broadcast.postEvent``
+        """
+        return self.event_dispatcher.post(self.subscriptions.get_listeners(event.__class__), event)
+
+    def __add_to_batch(self, info: Info):
+        self.__info_batch.append(info)
+        if len(self.__info_batch) >= self.server.config.info_batch_size:
+            self.flush_info_batch()
+        elif self.__info_batch_timer is None:
+            self.__info_batch_timer = asyncio.get_running_loop().call_later(
+                self.server.config.info_batch_window, self.flush_info_batch
+            )
+
+    def flush_info_batch(self):
+        """
+        Post the infos batched so far in an :class:`~aiomcdr.event.info.InfoBatchEvent` right now
+        """
+        if self.__info_batch_timer is not None:
+            self.__info_batch_timer.cancel()
+            self.__info_batch_timer = None
+        if self.__info_batch:
+            infos, self.__info_batch = self.__info_batch, []
+            self.post_event(InfoBatchEvent(self.server, infos))
+
+    async def __process_loop(self):
+        while True:
+            info = await self.info_queue.get()
+            try:
+                if isinstance(info, QueueMarker):
+                    info.callback()
+                else:
+                    await self.process_info(info)
+            except Exception:
+                logger.exception(f"处理信息 {info} 时出错")
+            finally:
+                self.info_queue.task_done()
+
+    def start(self):
+        """
+        Start the task that takes infos from the queue and reacts to them
+        """
+        if self.__process_task is None or self.__process_task.done():
+            self.__process_task = asyncio.create_task(self.__process_loop())
+
+    async def stop(self, timeout: Optional[float] = 5):
+        """
+        Stop the processing task after the remaining infos in the queue are processed
+
+        :param timeout: The maximum seconds to wait for the queue to be drained. None for no limit
+        """
+        if self.__process_task is None:
+            return
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.info_queue.join(), timeout)
+        self.__process_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.__process_task
+        self.__process_task = None
+        self.flush_info_batch()
+        await self.event_dispatcher.join(timeout)
+
+    def __warn_queue_full(self, message: str):
+        current_time = time.monotonic()
+        logging_method = logger.debug
+        if (
+            self.last_queue_full_warn_time is None
+            or current_time - self.last_queue_full_warn_time >= QUEUE_FULL_WARN_INTERVAL_SEC
+        ):
+            logging_method = logger.warning
+            self.last_queue_full_warn_time = current_time
+        logging_method(message)
+
     async def put_info(self, info: Info):
         info.attach_server(self.server)
+        # resolved before queueing, the listener waiting for the output might be blocking the processing of the queue
+        if info.is_from_server:
+            self.response_waiters.feed(info)
         # echo info from the server to the console
         # if info.is_from_server:
         #     logger.debug(info.raw_content)
-        await self.process_info(info)
-        # try:
-        #     self.server.task_executor.enqueue_info_task(lambda: self.process_info(info), info.is_user)
-        # except queue.Full:
-        #     current_time = time.monotonic()
-        #     logging_method = logger.debug
-        #     kwargs = {'option': DebugOption.REACTOR}
-        #     if (
-        #         self.last_queue_full_warn_time is None
-        #         or current_time - self.last_queue_full_warn_time >= core_constant.REACTOR_QUEUE_FULL_WARN_INTERVAL_SEC
-        #     ):
-        #         logging_method = logger.warning
-        #         kwargs = {}
-        #         self.last_queue_full_warn_time = current_time
-        #     logging_method(self.server.tr('info_reactor_manager.info_queue.full'), **kwargs)
+        try:
+            self.info_queue.put_nowait(info)
+        except asyncio.QueueFull:
+            policy = self.server.config.info_queue_overflow_policy
+            if policy == "drop_oldest":
+                self.__warn_queue_full("信息队列已满，已丢弃最早的一条非用户信息")
+                self.info_queue.drop_oldest()
+                self.info_queue.put_nowait(info)
+            elif policy == "drop_newest":
+                self.__warn_queue_full("信息队列已满，已丢弃最新的一条非用户信息")
+            else:
+                self.__warn_queue_full("信息队列已满，正在等待信息反应器处理")
+                await self.info_queue.put(info)
+
+    def call_after_queued_infos(self, callback: Callable[[], None]):
+        """
+        Call the callback once all the infos put so far are processed, before any info put after it
+
+        :param callback: A function without arguments
+        """
+        self.info_queue.put_marker(QueueMarker(callback))
 
     def on_server_start(self):
         for reactor in self.reactors:
@@ -0,0 +1,174 @@
+"""
+Measuring how long the listeners take to handle the events posted by aiomcdr
+"""
+import math
+import time
+from typing import Dict, List, Optional, Tuple, Type
+
+from graia.broadcast.entities.event import Dispatchable
+from graia.broadcast.entities.listener import Listener
+from loguru import logger
+
+SLOW_LISTENER_WARN_INTERVAL_SEC = 60
+
+# latencies are counted in buckets growing by 2 ** (1 / 8), i.e. about 9% apart, starting from 1us
+_BUCKET_BASE = 1e-6
+_BUCKETS_PER_DOUBLING = 8
+
+
+def _get_bucket(seconds: float) -> int:
+    if seconds <= _BUCKET_BASE:
+        return 0
+    return int(math.log2(seconds / _BUCKET_BASE) * _BUCKETS_PER_DOUBLING) + 1
+
+
+def _get_bucket_upper_bound(bucket: int) -> float:
+    return _BUCKET_BASE * 2 ** (bucket / _BUCKETS_PER_DOUBLING)
+
+
+def get_listener_plugin(listener: Listener) -> str:
+    """
+    The plugin module the listener is defined in
+    """
+    return getattr(listener.callable, "__module__", None) or "?"
+
+
+def get_listener_name(listener: Listener) -> str:
+    """
+    The name of a listener in the form of ``plugin module:function``
+    """
+    func = listener.callable
+    return f"{get_listener_plugin(listener)}:{getattr(func, '__qualname__', repr(func))}"
+
+
+class ListenerStats:
+    """
+    The call count and the latency histogram of a listener handling an event class
+    """
+
+    __slots__ = ("count", "total", "max", "__buckets")
+
+    def __init__(self):
+        self.count: int = 0
+        """The number of calls"""
+        self.total: float = 0.0
+        """Total seconds spent"""
+        self.max: float = 0.0
+        """The longest seconds spent on a call"""
+        self.__buckets: List[int] = []
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        bucket = _get_bucket(seconds)
+        if bucket >= len(self.__buckets):
+            self.__buckets.extend([0] * (bucket + 1 - len(self.__buckets)))
+        self.__buckets[bucket] += 1
+
+    def get_percentile(self, percent: float) -> float:
+        """
+        Return the latency in seconds that the given percent of the calls did not exceed, accurate to about 9%
+
+        :param percent: A number between 0 and 100
+        """
+        if self.count == 0:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket, count in enumerate(self.__buckets):
+            seen += count
+            if seen >= rank:
+                return min(_get_bucket_upper_bound(bucket), self.max)
+        return self.max
+
+    @property
+    def p50(self) -> float:
+        return self.get_percentile(50)
+
+    @property
+    def p99(self) -> float:
+        return self.get_percentile(99)
+
+    def __repr__(self):
+        return (
+            f"ListenerStats[count={self.count}, p50={self.p50 * 1000:.3f}ms, p99={self.p99 * 1000:.3f}ms, "
+            f"max={self.max * 1000:.3f}ms]"
+        )
+
+
+class ListenerMetrics:
+    """
+    The latency of each listener handling the events posted by aiomcdr. A listener taking longer than the budget gets
+    a warning naming its plugin module, at most once every :data:`SLOW_LISTENER_WARN_INTERVAL_SEC` seconds for each
+    listener
+    """
+
+    def __init__(self, budget: float):
+        """
+        :param budget: The seconds a listener may take to handle an event. 0 to never warn
+        """
+        self.budget = budget
+        self.__stats: Dict[Tuple[Listener, Type[Dispatchable]], ListenerStats] = {}
+        self.__last_warn_times: Dict[Listener, float] = {}
+
+    def get_stats(self) -> Dict[Tuple[Listener, Type[Dispatchable]], ListenerStats]:
+        """
+        Return the stats of the listeners, keyed by the listener and the event class it handled
+        """
+        return dict(self.__stats)
+
+    def reset(self):
+        self.__stats.clear()
+        self.__last_warn_times.clear()
+
+    def record(self, listener: Listener, event: Dispatchable, seconds: float):
+        """
+        Record a call of the listener handling the event
+        """
+        key = (listener, type(event))
+        stats = self.__stats.get(key)
+        if stats is None:
+            stats = self.__stats[key] = ListenerStats()
+        stats.record(seconds)
+        if 0 < self.budget < seconds:
+            current_time = time.monotonic()
+            last_warn_time = self.__last_warn_times.get(listener)
+            logging_method = logger.debug
+            if last_warn_time is None or current_time - last_warn_time >= SLOW_LISTENER_WARN_INTERVAL_SEC:
+                logging_method = logger.warning
+                self.__last_warn_times[listener] = current_time
+            logging_method(
+                f"监听器 {get_listener_name(listener)} 处理 {type(event).__name__} 耗时 {seconds * 1000:.1f}ms，"
+                f"超过了 {self.budget * 1000:.0f}ms 的预算"
+            )
+
+    def format_table(self, event_class: Optional[Type[Dispatchable]] = None) -> str:
+        """
+        Format the stats into a table sorted by p99, the slowest first
+
+        :param event_class: Only include the listeners of this event class. None for all
+        """
+        rows = [
+            (
+                get_listener_name(listener),
+                cls.__name__,
+                str(stats.count),
+                f"{stats.p50 * 1000:.2f}",
+                f"{stats.p99 * 1000:.2f}",
+                f"{stats.max * 1000:.2f}",
+            )
+            for (listener, cls), stats in sorted(self.__stats.items(), key=lambda item: item[1].p99, reverse=True)
+            if event_class is None or cls is event_class
+        ]
+        if not rows:
+            return "还没有监听器处理过事件"
+        header = ("listener", "event", "count", "p50(ms)", "p99(ms)", "max(ms)")
+        widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in (header, *rows)
+        )
@@ -0,0 +1,62 @@
+"""
+Tracking the players online in the server
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class OnlinePlayerRegistry:
+    """
+    The players online in the current server, interred from the player joined and left outputs of the server,
+    and corrected by the ``list`` command through rcon if enabled
+
+    Lookups are O(1). The player list is built once after each change and shared until the next one
+    """
+
+    def __init__(self):
+        self.__players: Dict[str, None] = {}  # in joining order
+        self.__snapshot: Optional[Tuple[str, ...]] = ()
+
+    def __len__(self) -> int:
+        return len(self.__players)
+
+    def __contains__(self, player: str) -> bool:
+        return player in self.__players
+
+    def get_players(self) -> Tuple[str, ...]:
+        """
+        Return the names of the online players, in the order they joined
+        """
+        if self.__snapshot is None:
+            self.__snapshot = tuple(self.__players)
+        return self.__snapshot
+
+    def add(self, player: str):
+        if player not in self.__players:
+            self.__players[player] = None
+            self.__snapshot = None
+
+    def remove(self, player: str):
+        if player in self.__players:
+            del self.__players[player]
+            self.__snapshot = None
+
+    def clear(self):
+        if self.__players:
+            self.__players.clear()
+            self.__snapshot = ()
+
+    def reconcile(self, players: Iterable[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Replace the online players with the given ones, e.g. the result of a ``list`` command
+
+        :param players: The names of all the players online
+        :return: The players missing from the registry, and the players that should not be in the registry
+        """
+        players = dict.fromkeys(players)
+        missing = tuple(player for player in players if player not in self.__players)
+        extra = tuple(player for player in self.__players if player not in players)
+        for player in extra:
+            self.remove(player)
+        for player in missing:
+            self.add(player)
+        return missing, extra
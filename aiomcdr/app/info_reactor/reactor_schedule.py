@@ -0,0 +1,181 @@
+"""
+Running the info reactors concurrently in the order they declared
+"""
+import asyncio
+import contextlib
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from loguru import logger
+
+from .abstract_info_reactor import AbstractInfoReactor
+from .info import Info
+
+if TYPE_CHECKING:
+    from ..server_phase import ServerPhase
+
+ReactFunction = Callable[[AbstractInfoReactor, Info], Awaitable[None]]
+
+
+class ReactorTiming:
+    """
+    The time an info reactor spent reacting to infos
+    """
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count: int = 0
+        """The number of infos reacted to"""
+        self.total: float = 0.0
+        """Total seconds spent"""
+        self.max: float = 0.0
+        """The longest seconds spent on a single info"""
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        """Average seconds spent on an info"""
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def __repr__(self):
+        return f"ReactorTiming[count={self.count}, mean={self.mean * 1000:.3f}ms, max={self.max * 1000:.3f}ms]"
+
+
+def _is_concurrent(reactor: AbstractInfoReactor) -> bool:
+    return reactor.dependencies is not None or reactor.pure
+
+
+class ReactorSchedule:
+    """
+    The order in which the info reactors react to an info
+
+    A reactor declaring :attr:`~AbstractInfoReactor.dependencies` or :attr:`~AbstractInfoReactor.pure` reacts in its own
+    task as soon as the registered reactors that are instances of its dependencies are done, concurrently with others.
+    The other reactors react one by one in registration order, each of them waiting for all the non-pure reactors
+    registered before it. Without concurrent reactors there is no task to create, and reacting costs nothing extra
+
+    All reactors are done with an info before :meth:`react` returns, so infos are still reacted to one by one
+    """
+
+    def __init__(self, reactors: Sequence[AbstractInfoReactor]):
+        self.reactors: Tuple[AbstractInfoReactor, ...] = tuple(reactors)
+        self.predecessors: Dict[AbstractInfoReactor, Tuple[AbstractInfoReactor, ...]] = {}
+        for index, reactor in enumerate(self.reactors):
+            if reactor.dependencies is not None:
+                dependencies = tuple(reactor.dependencies)
+                predecessors = [
+                    other
+                    for other in self.reactors
+                    if other is not reactor and any(isinstance(other, dependency) for dependency in dependencies)
+                ]
+            elif reactor.pure:
+                predecessors = []
+            else:
+                predecessors = [other for other in self.reactors[:index] if not other.pure]
+            self.predecessors[reactor] = tuple(predecessors)
+
+        order = self.__get_topological_order()
+        if order is None:
+            logger.error("信息反应器的依赖存在循环，将按注册顺序逐个执行所有信息反应器")
+            self.concurrent: Tuple[AbstractInfoReactor, ...] = ()
+            self.sequential: Tuple[AbstractInfoReactor, ...] = self.reactors
+            self.predecessors = {reactor: self.reactors[:index] for index, reactor in enumerate(self.reactors)}
+        else:
+            self.concurrent = tuple(reactor for reactor in order if _is_concurrent(reactor))
+            self.sequential = tuple(reactor for reactor in order if not _is_concurrent(reactor))
+        # sequential reactors that concurrent ones wait for
+        self.__awaited: Set[AbstractInfoReactor] = {
+            predecessor
+            for reactor in self.concurrent
+            for predecessor in self.predecessors[reactor]
+            if not _is_concurrent(predecessor)
+        }
+
+    def __get_topological_order(self) -> Optional[List[AbstractInfoReactor]]:
+        order: List[AbstractInfoReactor] = []
+        visited: Set[AbstractInfoReactor] = set()
+        visiting: Set[AbstractInfoReactor] = set()
+
+        def visit(reactor: AbstractInfoReactor) -> bool:
+            if reactor in visited:
+                return True
+            if reactor in visiting:
+                return False
+            visiting.add(reactor)
+            if not all(visit(predecessor) for predecessor in self.predecessors[reactor]):
+                return False
+            visiting.discard(reactor)
+            visited.add(reactor)
+            order.append(reactor)
+            return True
+
+        return order if all(visit(reactor) for reactor in self.reactors) else None
+
+    def describe(self) -> str:
+        """
+        A readable description of the schedule, for logging
+        """
+        text = " -> ".join(type(reactor).__name__ for reactor in self.sequential)
+        for reactor in self.concurrent:
+            text += f", {type(reactor).__name__}({', '.join(type(p).__name__ for p in self.predecessors[reactor])})"
+        return text
+
+    async def react(self, info: Info, phase: "ServerPhase", react: ReactFunction):
+        """
+        Let the reactors active in the given phase react to the info with the given react function
+        """
+        if not self.concurrent:
+            for reactor in self.sequential:
+                if reactor.phases is None or phase in reactor.phases:
+                    await react(reactor, info)
+            return
+
+        loop = asyncio.get_running_loop()
+        done: Dict[AbstractInfoReactor, asyncio.Future] = {reactor: loop.create_future() for reactor in self.__awaited}
+        tasks: Dict[AbstractInfoReactor, asyncio.Future] = {}
+
+        async def react_after(reactor: AbstractInfoReactor, waits: List[asyncio.Future]):
+            for future in waits:
+                await future
+            await react(reactor, info)
+
+        for reactor in self.concurrent:
+            if reactor.phases is None or phase in reactor.phases:
+                waits = [
+                    tasks[p] if p in tasks else done[p] for p in self.predecessors[reactor] if p in tasks or p in done
+                ]
+                tasks[reactor] = loop.create_task(react_after(reactor, waits))
+        try:
+            for reactor in self.sequential:
+                for predecessor in self.predecessors[reactor]:
+                    task = tasks.get(predecessor)
+                    if task is not None:
+                        await task
+                if reactor.phases is None or phase in reactor.phases:
+                    await react(reactor, info)
+                future = done.get(reactor)
+                if future is not None:
+                    future.set_result(None)
+            for task in tasks.values():
+                await task
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await task
@@ -0,0 +1,123 @@
+"""
+Matching the server outputs to the commands waiting for them
+"""
+import asyncio
+import re
+from typing import Dict, Pattern, Set, Union
+
+from .info import Info
+
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def get_literal_prefix(pattern: Pattern[str]) -> str:
+    """
+    Return the literal text every string matching the regex from its start begins with, e.g. ``"There are "`` for
+    ``r"There are (\\d+) of a max"``. It might be shorter than the real one, but never longer
+
+    :param pattern: A compiled regex
+    """
+    text = pattern.pattern
+    if not isinstance(text, str) or pattern.flags & (re.IGNORECASE | re.VERBOSE) or "|" in text:
+        return ""
+    prefix = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "\\":
+            if i + 1 >= len(text) or text[i + 1].isalnum():  # a character class like \d, or an anchor like \A
+                break
+            literal, step = text[i + 1], 2
+        elif char in _REGEX_SPECIAL_CHARS:
+            break
+        else:
+            literal, step = char, 1
+        quantifier = text[i + step] if i + step < len(text) else ""
+        if quantifier in ("*", "?", "{"):  # the character might not be there
+            break
+        prefix.append(literal)
+        if quantifier == "+":
+            break
+        i += step
+    return "".join(prefix)
+
+
+class ResponseWaiter:
+    __slots__ = ("pattern", "prefix", "future")
+
+    def __init__(self, pattern: Pattern[str], prefix: str, future: "asyncio.Future[Info]"):
+        self.pattern = pattern
+        self.prefix = prefix
+        self.future = future
+
+
+class ResponseWaiterTable:
+    """
+    The pending waiters for the server outputs matching a regex, e.g. the output of a command just executed
+
+    Like :class:`~aiomcdr.app.info_reactor.info_listener_index.InfoListenerIndex`, the waiters are indexed by the
+    first word of the literal prefix of their regex, so an info only tries the regexes of the waiters its first
+    word may match, no matter how many waiters there are
+    """
+
+    def __init__(self):
+        # first word of the prefix -> waiters, dicts are used as ordered sets
+        self.__prefix_index: Dict[str, Dict[ResponseWaiter, None]] = {}
+        # waiters whose prefix is not a complete first word, including the ones without a prefix
+        self.__short_prefixed: Dict[ResponseWaiter, None] = {}
+        self.__count = 0
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def add(self, pattern: Union[str, Pattern[str]]) -> ResponseWaiter:
+        """
+        Wait for an info whose content matches the regex from its start, same as ``re.match``
+
+        :return: The waiter, whose future is resolved with the matching info. :meth:`remove` it once done
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        prefix = get_literal_prefix(regex)
+        waiter = ResponseWaiter(regex, prefix, asyncio.get_running_loop().create_future())
+        first_word, space, _ = prefix.partition(" ")
+        if space:
+            self.__prefix_index.setdefault(first_word, {})[waiter] = None
+        else:
+            self.__short_prefixed[waiter] = None
+        self.__count += 1
+        return waiter
+
+    def remove(self, waiter: ResponseWaiter):
+        first_word, space, _ = waiter.prefix.partition(" ")
+        waiters = self.__prefix_index.get(first_word) if space else self.__short_prefixed
+        if waiters is not None and waiter in waiters:
+            del waiters[waiter]
+            self.__count -= 1
+            if space and not waiters:
+                del self.__prefix_index[first_word]
+        if not waiter.future.done():
+            waiter.future.cancel()
+
+    def feed(self, info: Info):
+        """
+        Resolve the waiters the info matches. For the waiters with the same regex, only the oldest one is resolved,
+        so each of the same commands executed at the same time gets its own output
+
+        The infos from users are ignored, so a player cannot fake the output of a command by chatting
+        """
+        content = info.content
+        if self.__count == 0 or not content or info.is_user:
+            return
+        candidates = list(self.__prefix_index.get(content.partition(" ")[0], ()))
+        candidates.extend(self.__short_prefixed)
+        matched_patterns: Set[Pattern[str]] = set()
+        for waiter in candidates:
+            if (
+                waiter.pattern not in matched_patterns
+                and not waiter.future.done()
+                and content.startswith(waiter.prefix)
+                and waiter.pattern.match(content) is not None
+            ):
+                matched_patterns.add(waiter.pattern)
+                waiter.future.set_result(info)
+                self.remove(waiter)
@@ -0,0 +1,82 @@
+"""
+Tracking which events have listeners, so reactors can skip the unsubscribed ones
+"""
+from typing import Dict, List, Optional, Type
+
+from graia.broadcast import Broadcast
+from graia.broadcast.entities.event import Dispatchable
+from graia.broadcast.entities.listener import Listener
+from graia.saya.event import SayaModuleInstalled, SayaModuleUninstalled
+from loguru import logger
+
+from .info_listener_index import InfoListenerIndex
+
+
+class SubscriptionRegistry:
+    """
+    A cache of the listeners of each event class in a :class:`~graia.broadcast.Broadcast`
+
+    Lookups are a dict access as long as the listener list stays the same.
+    The cache is rebuilt after a Saya module is installed or uninstalled, or when the listener list is seen
+    to have grown, shrunk or changed its last listener. Call :meth:`invalidate` after changing listeners
+    in other ways, e.g. hiding a namespace or adding an event to an existing listener
+    """
+
+    def __init__(self, bcc: Broadcast):
+        self.bcc = bcc
+        self.__listeners: Dict[Type[Dispatchable], List[Listener]] = {}
+        self.__info_listener_indexes: Dict[Type[Dispatchable], InfoListenerIndex] = {}
+        # the listener list the cache is built from, seen as its length and its last listener
+        self.__listener_count = -1
+        self.__last_listener: Optional[Listener] = None
+        bcc.receiver(SayaModuleInstalled)(self.__on_saya_module_changed)
+        bcc.receiver(SayaModuleUninstalled)(self.__on_saya_module_changed)
+
+    async def __on_saya_module_changed(self):
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drop the cached listeners, they will be collected again on the next lookup
+        """
+        self.__listeners.clear()
+        self.__info_listener_indexes.clear()
+        self.__listener_count = -1
+
+    def get_listeners(self, event_class: Type[Dispatchable]) -> List[Listener]:
+        """
+        Return the listeners that receive the given event class, the same ones ``Broadcast.postEvent`` would invoke
+
+        The returned list is cached, do not modify
+        """
+        all_listeners = self.bcc.listeners
+        if len(all_listeners) != self.__listener_count or (
+            all_listeners and all_listeners[-1] is not self.__last_listener
+        ):
+            self.__listeners.clear()
+            self.__info_listener_indexes.clear()
+            self.__listener_count = len(all_listeners)
+            self.__last_listener = all_listeners[-1] if all_listeners else None
+        listeners = self.__listeners.get(event_class)
+        if listeners is None:
+            listeners = self.__listeners[event_class] = list(self.bcc.default_listener_generator(event_class))
+            logger.debug(f"事件 {event_class.__name__} 有 {len(listeners)} 个监听器")
+        return listeners
+
+    def has_listeners(self, event_class: Type[Dispatchable]) -> bool:
+        """
+        If anyone listens to the given event class
+        """
+        return len(self.get_listeners(event_class)) > 0
+
+    def get_info_listener_index(self, event_class: Type[Dispatchable]) -> InfoListenerIndex:
+        """
+        Return the index of the listeners of an info event class, to pick the ones whose info filters match an info
+
+        The returned index is cached, do not modify
+        """
+        listeners = self.get_listeners(event_class)
+        index = self.__info_listener_indexes.get(event_class)
+        if index is None:
+            index = self.__info_listener_indexes[event_class] = InfoListenerIndex(listeners)
+        return index
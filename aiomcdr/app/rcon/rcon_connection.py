@@ -0,0 +1,162 @@
+"""
+An asyncio rcon client that pipelines the commands
+"""
+import asyncio
+import contextlib
+import struct
+from typing import Dict, List, Optional, Tuple
+
+
+class PacketType:
+    COMMAND_RESPONSE = 0
+    COMMAND_REQUEST = 2
+    LOGIN_REQUEST = 3
+    LOGIN_FAIL = -1
+    ENDING_PACKET = 100
+
+
+def pack_packet(packet_id: int, packet_type: int, payload: str) -> bytes:
+    data = struct.pack("<ii", packet_id, packet_type) + payload.encode("utf8") + b"\x00\x00"
+    return struct.pack("<i", len(data)) + data
+
+
+async def read_packet(reader: asyncio.StreamReader) -> Tuple[int, int, str]:
+    """
+    :return: The id, the type and the payload of the packet
+    """
+    (length,) = struct.unpack("<i", await reader.readexactly(4))
+    data = await reader.readexactly(length)
+    packet_id, packet_type = struct.unpack("<ii", data[:8])
+    return packet_id, packet_type, data[8:-2].decode("utf8", errors="replace")
+
+
+class RconConnection:
+    """
+    A rcon connection that sends the commands without waiting for the responses of the previous ones
+
+    Each command is followed by a packet of an invalid type, which the server answers with the same id after it has
+    answered the command, so a response split into several packets is complete once that answer arrives.
+    The responses are matched to the commands by the packet ids
+    """
+
+    def __init__(self, address: str, port: int, password: str, max_in_flight: int = 16):
+        """
+        :param address: The address of the rcon server
+        :param port: The port of the rcon server
+        :param password: The password of the rcon server
+        :param max_in_flight: The maximum number of commands waiting for their responses. Zero or negative means
+            unlimited
+        """
+        self.address = address
+        self.port = port
+        self.password = password
+        self.max_in_flight = max_in_flight
+        self.__reader: Optional[asyncio.StreamReader] = None
+        self.__writer: Optional[asyncio.StreamWriter] = None
+        self.__read_task: Optional[asyncio.Task] = None
+        self.__requests: Dict[int, Tuple[List[str], asyncio.Future]] = {}
+        self.__next_id = 1
+        self.__slots = asyncio.Semaphore(max_in_flight) if max_in_flight > 0 else None
+
+    @property
+    def connected(self) -> bool:
+        return self.__writer is not None
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of commands waiting for their responses
+        """
+        return len(self.__requests)
+
+    async def connect(self, timeout: Optional[float] = None) -> bool:
+        """
+        Connect to the rcon server and log in
+
+        :param timeout: The maximum seconds to wait. None for no limit
+        :return: If the login succeeded
+        :raise OSError: If the connection failed
+        """
+        self.disconnect()
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.address, self.port), timeout)
+        try:
+            writer.write(pack_packet(0, PacketType.LOGIN_REQUEST, self.password))
+            packet_id, _, _ = await asyncio.wait_for(read_packet(reader), timeout)
+        except BaseException:
+            writer.close()
+            raise
+        if packet_id == PacketType.LOGIN_FAIL:
+            writer.close()
+            return False
+        self.__reader, self.__writer = reader, writer
+        self.__read_task = asyncio.create_task(self.__read_loop(reader))
+        return True
+
+    def disconnect(self):
+        """
+        Close the connection. The commands waiting for their responses raise :class:`ConnectionResetError`
+        """
+        if self.__read_task is not None:
+            self.__read_task.cancel()
+            self.__read_task = None
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__reader = self.__writer = None
+        self.__fail_requests(ConnectionResetError("rcon connection closed"))
+
+    def __fail_requests(self, exception: BaseException):
+        for _, future in self.__requests.values():
+            if not future.done():
+                future.set_exception(exception)
+        self.__requests.clear()
+
+    def __allocate_id(self) -> int:
+        # a command uses 2 ids, one for itself and one for its ending packet
+        packet_id = self.__next_id
+        self.__next_id = packet_id + 2 if packet_id < 2**30 else 1
+        return packet_id
+
+    async def __read_loop(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                packet_id, _, payload = await read_packet(reader)
+                request = self.__requests.get(packet_id)
+                if request is not None:
+                    request[0].append(payload)
+                    continue
+                request = self.__requests.pop(packet_id - 1, None)  # the answer to an ending packet
+                if request is not None and not request[1].done():
+                    request[1].set_result("".join(request[0]))
+        except (OSError, asyncio.IncompleteReadError, struct.error) as e:
+            if self.__writer is not None:
+                self.__writer.close()
+                self.__reader = self.__writer = None
+            self.__read_task = None
+            self.__fail_requests(ConnectionResetError(f"rcon connection lost: {e!r}"))
+
+    async def query(self, command: str, timeout: Optional[float] = None) -> str:
+        """
+        Send a command and wait for its response
+
+        :param command: The command to send
+        :param timeout: The maximum seconds to wait for the response. None for no limit
+        :return: The response of the command
+        :raise ConnectionError: If the connection is not established or is lost
+        :raise asyncio.TimeoutError: If the response does not arrive in time
+        """
+        async with self.__slots if self.__slots is not None else contextlib.nullcontext():
+            writer = self.__writer
+            if writer is None:
+                raise ConnectionResetError("rcon is not connected")
+            packet_id = self.__allocate_id()
+            future = asyncio.get_running_loop().create_future()
+            self.__requests[packet_id] = ([], future)
+            try:
+                writer.write(
+                    pack_packet(packet_id, PacketType.COMMAND_REQUEST, command)
+                    + pack_packet(packet_id + 1, PacketType.ENDING_PACKET, "")
+                )
+                await writer.drain()
+                return await asyncio.wait_for(future, timeout)
+            finally:
+                self.__requests.pop(packet_id, None)
@@ -0,0 +1,100 @@
+"""
+The rcon connections of aiomcdr to the server
+"""
+import asyncio
+from typing import TYPE_CHECKING, List, Optional
+
+from loguru import logger
+
+from .rcon_connection import RconConnection
+
+if TYPE_CHECKING:
+    from ..config import RconConfig
+
+
+class RconManager:
+    """
+    A small pool of authenticated rcon connections. A query goes to the connection with the fewest commands waiting
+    for their responses. If the connection is lost, it's reconnected and the query is retried once
+    """
+
+    def __init__(self, config: "RconConfig"):
+        self.config = config
+        self.__connections: List[RconConnection] = []
+        self.__connect_lock = asyncio.Lock()
+
+    def is_running(self) -> bool:
+        return any(connection.connected for connection in self.__connections)
+
+    async def connect(self) -> bool:
+        """
+        Disconnect the existing connections, then open the connections of the pool
+
+        :return: If at least one connection is logged in
+        """
+        async with self.__connect_lock:
+            self.disconnect()
+            config = self.config
+            logger.info(f"正在连接 RCON ({config.address}:{config.port})")
+            connections = [
+                RconConnection(config.address, config.port, config.password, config.max_in_flight)
+                for _ in range(max(config.pool_size, 1))
+            ]
+            results = await asyncio.gather(
+                *(connection.connect(config.timeout) for connection in connections), return_exceptions=True
+            )
+            self.__connections = [connection for connection, ok in zip(connections, results) if ok is True]
+            if not self.__connections:
+                error = next((result for result in results if isinstance(result, BaseException)), None)
+                if error is None:
+                    logger.warning("RCON 登录失败，请检查密码")
+                else:
+                    logger.warning(f"RCON 连接失败: {error!r}")
+                return False
+            logger.info(f"RCON 已连接，共 {len(self.__connections)} 个连接")
+            return True
+
+    def disconnect(self):
+        if self.__connections:
+            for connection in self.__connections:
+                connection.disconnect()
+            self.__connections = []
+            logger.info("RCON 已断开")
+
+    async def query(self, command: str, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Send a command through rcon and wait for its response
+
+        :param command: The command to send
+        :param timeout: The maximum seconds to wait for the response. None to use the timeout in the config
+        :return: The response of the command. None if rcon is not connected or the query failed
+        """
+        if timeout is None:
+            timeout = self.config.timeout
+        for retry in range(2):
+            connections = [connection for connection in self.__connections if connection.connected]
+            if connections:
+                connection = min(connections, key=lambda c: c.in_flight)
+            elif self.__connections and retry == 0:  # all lost, e.g. the server restarted its rcon
+                connection = self.__connections[0]
+                if not await self.__reconnect(connection):
+                    return None
+            else:
+                return None
+            try:
+                return await connection.query(command, timeout)
+            except ConnectionError as e:
+                logger.warning(f"RCON 查询失败: {e}")
+                if retry == 0:
+                    await self.__reconnect(connection)
+            except asyncio.TimeoutError:
+                logger.warning(f'RCON 查询 "{command}" 在 {timeout}s 内没有响应')
+                return None
+        return None
+
+    async def __reconnect(self, connection: RconConnection) -> bool:
+        try:
+            return await connection.connect(self.config.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.warning(f"RCON 重新连接失败: {e!r}")
+            return False
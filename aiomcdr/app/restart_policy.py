@@ -0,0 +1,51 @@
+"""
+Deciding whether and when to start the server again after it exits unexpectedly
+"""
+import collections
+import time
+from typing import Deque, Optional
+
+from .config import AutoRestartConfig
+
+
+class RestartPolicy:
+    """
+    Restarts a crashed server with an exponential backoff, and gives up on a server crashing too often
+
+    - The first crash after a healthy run restarts the server at once, every following crash doubles the delay,
+      starting from ``backoff_initial`` and capped at ``backoff_max`` seconds
+    - A run lasting ``healthy_uptime`` seconds resets the backoff
+    - If the server has already been restarted ``max_restarts`` times within the last ``window`` seconds,
+      the policy gives up
+    """
+
+    def __init__(self, config: AutoRestartConfig):
+        self.config = config
+        self.consecutive_crashes: int = 0
+        """The number of crashes since the last healthy run"""
+        self.__restart_times: Deque[float] = collections.deque()
+
+    def on_crash(self, uptime: float) -> Optional[float]:
+        """
+        Record a crash of the server
+
+        :param uptime: The seconds the crashed server had been running
+        :return: The seconds to wait before starting the server again. None to not start it again
+        """
+        config = self.config
+        if not config.enabled:
+            return None
+        if uptime >= config.healthy_uptime:
+            self.consecutive_crashes = 0
+        self.consecutive_crashes += 1
+
+        current_time = time.monotonic()
+        while self.__restart_times and current_time - self.__restart_times[0] > config.window:
+            self.__restart_times.popleft()
+        if config.max_restarts > 0 and len(self.__restart_times) >= config.max_restarts:
+            return None
+        self.__restart_times.append(current_time)
+
+        if self.consecutive_crashes <= 1:
+            return 0.0
+        return min(config.backoff_initial * 2 ** (self.consecutive_crashes - 2), config.backoff_max)
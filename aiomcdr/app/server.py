@@ -4,15 +4,15 @@ import locale
 import os
 import subprocess
 import sys
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Iterable
 
 import psutil
-from creart import create, it
+from creart import it
 from graia.broadcast import Broadcast
 from kayaku import create as create_config
 from launart import Launart
 from loguru import logger
-from mcdreforged.utils.exception import DecodeError
 
 from aiomcdr.app.config import MCDRConfig
 from aiomcdr.app.handler.impl import (
@@ -27,16 +27,30 @@ from aiomcdr.app.handler.impl import (
     WaterfallHandler,
 )
 from aiomcdr.app.info_reactor.info_reactor_manager import InfoReactorManager
+from aiomcdr.app.info_reactor.online_player_registry import OnlinePlayerRegistry
 from aiomcdr.app.info_reactor.server_information import ServerInformation
 from aiomcdr.app.permission.permission_manager import PermissionManager
+from aiomcdr.app.rcon.rcon_manager import RconManager
+from aiomcdr.app.restart_policy import RestartPolicy
 from aiomcdr.app.server_interface import MinecraftServerInterface
-from aiomcdr.event.lifetime import ApplicationLaunching, ApplicationShutdown
+from aiomcdr.app.server_phase import ServerPhase
+from aiomcdr.app.stdin_writer import ServerStdinWriter
+from aiomcdr.app.stdout_decoder import ServerStdoutDecoder
+from aiomcdr.app.stdout_reader import ServerStdoutReader
+from aiomcdr.event.lifetime import (
+    ApplicationCrashed,
+    ApplicationLaunching,
+    ApplicationRestarting,
+    ApplicationShutdown,
+)
 
 if TYPE_CHECKING:
     from loguru import Logger
 
     from aiomcdr.app.handler.abstract_server_handler import AbstractServerHandler
 
+WAIT_EXIT_LOG_INTERVAL_SEC = 30
+
 handlers_map = {
     "vanilla_handler": VanillaHandler,
     "beta18_handler": Beta18Handler,
@@ -52,17 +66,21 @@ handlers_map = {
 
 class MinecraftServer:
     mgr: Launart | None = None
-    tasks: list[asyncio.Task] = []
-    proc: asyncio.subprocess.Process | None
+    proc: asyncio.subprocess.Process | None = None
+    stdout_reader: ServerStdoutReader | None = None
+    stdin_writer: ServerStdinWriter | None = None
     server_runnning: bool = False
+    phase: ServerPhase = ServerPhase.STOPPED
     broadcast: Broadcast
     config: MCDRConfig
     handler: "AbstractServerHandler"
     encoding: str
     decoding: str
     server_information: ServerInformation
+    online_players: OnlinePlayerRegistry
     server_interface: MinecraftServerInterface
     reactor_manager: InfoReactorManager
+    rcon_manager: RconManager
     console_logger: "Logger"
     server_logger: "Logger"
 
@@ -73,15 +91,45 @@ class MinecraftServer:
         self.broadcast = it(Broadcast)
         self.config = create_config(MCDRConfig)
         self.handler: "AbstractServerHandler" = handlers_map[self.config.handler]()
+        self.handler.lazy_parsing = self.config.info_lazy_parsing
         self.encoding = self.config.encoding or sys.getdefaultencoding()
         self.decoding = self.config.decoding or locale.getpreferredencoding()
         self.server_information = ServerInformation()
+        self.online_players = OnlinePlayerRegistry()
         self.permission_manager = PermissionManager(self)
         self.server_interface = MinecraftServerInterface(self)
         self.reactor_manager = InfoReactorManager(self.broadcast, self)
         self.reactor_manager.register_reactors()
+        self.rcon_manager = RconManager(self.config.rcon)
+        self.__rcon_connect_task: asyncio.Task | None = None
         self.console_logger = logger.bind(name="Console")
         self.server_logger = logger.bind(name="Server")
+        self.__process_started = asyncio.Event()
+        self.__stop_requested = asyncio.Event()
+        self.__restart_requested = False
+        self.__stopped = asyncio.Event()
+        self.__stopped.set()
+        self.__launch_time: float | None = None
+        self.__return_code: int | None = None
+
+    def set_phase(self, phase: ServerPhase) -> bool:
+        """
+        Enter a lifecycle phase of the server
+
+        The phase decides which probes of the server handler are applied to the infos. It's only changed on the info
+        processing side, in order with the infos, see :meth:`InfoReactorManager.call_after_queued_infos`
+
+        :return: If the phase is entered. A transition the current phase cannot make, e.g. from stopped to stopping
+            because of an outdated info, is ignored
+        """
+        if phase is self.phase:
+            return True
+        if not self.phase.can_enter(phase):
+            logger.debug(f"忽略服务端阶段变化: {self.phase.value} -> {phase.value}")
+            return False
+        logger.debug(f"服务端阶段: {self.phase.value} -> {phase.value}")
+        self.phase = phase
+        return True
 
     async def start_server(self):
         self.proc = await asyncio.create_subprocess_shell(
@@ -94,113 +142,209 @@ class MinecraftServer:
             creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == "nt" else 0,
         )
 
-    async def __kill_server(self):
-        if self.proc is not None and self.proc.returncode is not None:
+    async def __kill_server(self, proc: asyncio.subprocess.Process):
+        if proc.returncode is None:
             logger.info("正在杀死服务端进程组")
             with contextlib.suppress(psutil.NoSuchProcess):
-                root = psutil.Process(self.proc.pid)
+                root = psutil.Process(proc.pid)
                 processes = [root]
                 processes.extend(root.children(recursive=True))
-                for proc in reversed(processes):  # child first, parent last
+                for process in reversed(processes):  # child first, parent last
                     with contextlib.suppress(psutil.NoSuchProcess):
-                        proc_pid, proc_name = proc.pid, proc.name()  # in case we cannot get them after the process dies
-                        proc.kill()
+                        proc_pid, proc_name = process.pid, process.name()  # in case we cannot get them after it dies
+                        process.kill()
                         logger.info("进程 {0} (pid {1}) 已杀死", proc_name, proc_pid)
         else:
             logger.warning("当服务器进程已经终止时，尝试终止服务器")
 
+    async def __wait_for_exit(self, proc: asyncio.subprocess.Process, timeout: float) -> bool:
+        """
+        Wait for the server process to exit, logging the progress every :data:`WAIT_EXIT_LOG_INTERVAL_SEC` seconds
+
+        :param proc: The server process
+        :param timeout: The maximum seconds to wait
+        :return: If the process exited in time
+        """
+        waiter = asyncio.ensure_future(proc.wait())
+        waited = 0.0
+        try:
+            while waited < timeout:
+                interval = min(WAIT_EXIT_LOG_INTERVAL_SEC, timeout - waited)
+                done, _ = await asyncio.wait({waiter}, timeout=interval)
+                if done:
+                    return True
+                waited += interval
+                if waited < timeout:
+                    logger.info(f"已等待服务端进程停止 {waited:.0f}s，若 {timeout - waited:.0f}s 后服务器进程仍未退出，则杀死他")
+            return False
+        finally:
+            waiter.cancel()
+
     async def check_stop(self, mgr: Launart):
-        await asyncio.sleep(0.1)  # 等待服务器先启动，否则不生效
-        while self.server_runnning and self.proc is not None:
-            if mgr.status.exiting and self.proc.stdin is not None:
-                logger.warning("服务器正在关闭，再次按下 Ctrl-C 会强制结束服务器进程，但可能会造成回档或坏档")
-                await self.send("stop")
-                break
-            await asyncio.sleep(0.5)
+        """
+        Send the stop command to the server when the manager starts exiting, and kill the server if it does not exit in time
+        after a stop is requested
+
+        Everything here is awaited on the process exit and the manager status, so there's no wakeup while the server
+        runs normally
+        """
+        await self.__process_started.wait()
+        proc = self.proc
+        if proc is None:
+            return
+        waiters = {
+            asyncio.ensure_future(proc.wait()),
+            asyncio.ensure_future(mgr.status.wait_for_sigexit()),
+            asyncio.ensure_future(self.__stop_requested.wait()),
+        }
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        if proc.returncode is not None:
+            return
+        if not self.__stop_requested.is_set() and self.server_runnning and proc.stdin is not None:
+            logger.warning("服务器正在关闭，再次按下 Ctrl-C 会强制结束服务器进程，但可能会造成回档或坏档")
+            await self.send(self.handler.get_stop_command())
         total_wait_seconds = 360
-        for _ in range(total_wait_seconds):
-            if self.proc is None:
-                break
-            try:
-                if self.proc.returncode is not None:
-                    break
-                await asyncio.sleep(1)
-            except asyncio.TimeoutError:
-                if _ % 30 == 0:
-                    logger.info(f"已等待服务端进程停止 {_}s，若 {total_wait_seconds - _}s 后服务器进程仍未退出，则杀死他")
-            else:
-                break
-        else:
-            logger.error("服务器进程在{total_wait_seconds}s内未退出，杀死他")
-            await self.__kill_server()
-        return
+        if not await self.__wait_for_exit(proc, total_wait_seconds):
+            logger.error(f"服务器进程在 {total_wait_seconds}s 内未退出，杀死他")
+            await self.__kill_server(proc)
+
+    async def stop(self, restart: bool = False):
+        """
+        Send the stop command of the handler to the server, e.g. ``stop``.
+        The application exits along with the server unless it's a restart
+
+        :param restart: Start the server again after it stops, keeping the application running
+        """
+        self.__restart_requested = restart
+        await self.send(self.handler.get_stop_command())
+
+    async def wait_for_stop(self, timeout: float | None = None) -> bool:
+        """
+        Wait until the server process exits and its outputs are all read
+
+        :param timeout: The maximum seconds to wait. None for no limit
+        :return: If the server stopped in time
+        """
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.__stopped.wait(), timeout)
+        return self.__stopped.is_set()
+
+    async def restart(self) -> bool:
+        """
+        Stop the server if it's running, and wait for the server process to be started again
+
+        :return: If the server is started again. False if the application is exiting instead
+        """
+        if self.server_runnning:
+            await self.stop(restart=True)
+            await self.__stopped.wait()
+        if self.mgr is None:
+            return False
+        waiters = {
+            asyncio.ensure_future(self.__process_started.wait()),
+            asyncio.ensure_future(self.mgr.status.wait_for_sigexit()),
+        }
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return self.__process_started.is_set() and self.proc is not None
 
     # --------------------------
     #      Server Logics
     # --------------------------
 
-    async def send(self, text: str | bytes, ending: str = "\n", encoding: str | None = None):
+    async def send(
+        self, text: str | bytes, ending: str = "\n", encoding: str | None = None
+    ) -> asyncio.Future[None] | None:
         """
         Send a text to server's stdin if the server is running
 
+        The text is written by the stdin writer in the background, see :class:`ServerStdinWriter`
+
         :param text: A str or a bytes you want to send. if text is a str then it will attach the ending parameter to its
         back
         :param str ending: The suffix of a command with a default value
+        :return: A future resolved once the text is flushed to the server's stdin, or cancelled if it's discarded.
+            None if the server is not running
         """
+        return await self.__write_stdin(self.__encode_command(text, ending, encoding), text)
+
+    async def send_many(
+        self, texts: Iterable[str | bytes], ending: str = "\n", encoding: str | None = None
+    ) -> asyncio.Future[None] | None:
+        """
+        Send some texts to server's stdin if the server is running, with a single write to the stdin writer
+
+        The texts are written together, so none of them is discarded alone when the stdin buffer is full
+
+        :param texts: The str or bytes you want to send, see :meth:`send`
+        :param str ending: The suffix of a command with a default value
+        :return: A future resolved once all the texts are flushed to the server's stdin, or cancelled if they're
+            discarded. None if the server is not running or there's nothing to send
+        """
+        texts = list(texts)
+        if len(texts) == 0:
+            return None
+        encoded_text = b"".join(self.__encode_command(text, ending, encoding) for text in texts)
+        return await self.__write_stdin(encoded_text, texts[0])
+
+    def __encode_command(self, text: str | bytes, ending: str, encoding: str | None) -> bytes:
         if isinstance(text, str):
-            if text == "stop" and self.mgr:
-                self.mgr.status.exiting = True
-            encoded_text = (text + ending).encode(encoding or self.encoding)
+            stop_command = self.handler.get_stop_command()
+            if stop_command and text == stop_command:
+                self.__stop_requested.set()
+                if self.mgr and not self.__restart_requested:
+                    self.mgr.status.exiting = True
+            return (text + ending).encode(encoding or self.encoding)
         elif isinstance(text, bytes):
-            encoded_text = text
+            return text
         else:
             raise TypeError()
 
+    async def __write_stdin(self, encoded_text: bytes, text: str | bytes) -> asyncio.Future[None] | None:
         if self.proc is None:
             raise ValueError("Minecraft Server has not been initialized yet.")
-        if self.server_runnning and self.proc.stdin is not None:
-            self.proc.stdin.write(encoded_text)
-        else:
-            logger.warning("服务端已关闭，不能向其标准输入流输入指令")
-            logger.warning("被输入的指令: {0}", text if len(text) <= 32 else f"{text[:32]}...")
+        if self.server_runnning and self.stdin_writer is not None and not self.stdin_writer.closed:
+            return await self.stdin_writer.write(encoded_text)
+        logger.warning("服务端已关闭，不能向其标准输入流输入指令")
+        logger.warning("被输入的指令: {0}", text if len(text) <= 32 else f"{text[:32]}...")
+        return None
+
+    def __create_stdout_decoder(self) -> ServerStdoutDecoder:
+        if self.config.decoding:
+            return ServerStdoutDecoder([self.config.decoding])
+        if os.name == "nt":
+            # Windows 上的服务端可能使用 UTF-8 也可能使用系统编码，在首次遇到非 ASCII 输出时检测一次
+            return ServerStdoutDecoder(["utf8", self.decoding])
+        return ServerStdoutDecoder([self.decoding])
+
+    def __report_decode_errors(self, decoder: ServerStdoutDecoder, reported_count: int) -> int:
+        if decoder.error_count > reported_count:
+            logging_method = logger.warning if reported_count == 0 else logger.debug
+            logging_method("服务端标准输出流中有 {0} 处字节无法使用 {1} 解码，已替换为 U+FFFD", decoder.error_count, decoder.encoding)
+        return decoder.error_count
 
-    async def __receive(self):
+    async def __receive(self) -> list[str] | None:
         if self.proc is None:
             raise ValueError("Minecraft Server has not been initialized yet.")
-        if self.proc.stdout is None:
+        if self.stdout_reader is None:
             return None
-        try:
-            text = await anext(self.proc.stdout)
-        except StopAsyncIteration:
-            for _ in range(60):
-                try:
-                    if self.proc.returncode is not None:
-                        break
-                    await asyncio.sleep(1)
-                except asyncio.TimeoutError:
-                    logger.info("等待服务端进程停止")
-                else:
-                    break
-            else:
+        lines = await self.stdout_reader.read_lines()
+        self.__reported_decode_error_count = self.__report_decode_errors(
+            self.stdout_reader.decoder, self.__reported_decode_error_count
+        )
+        if lines is None:
+            if not await self.__wait_for_exit(self.proc, 60):
                 logger.warning("服务器在其stdout关闭60秒后仍未停止，杀死他")
-                await self.__kill_server()
-            return
-        else:
-            if os.name == "nt":
-                try:
-                    decoded_text: str = text.decode("utf8")
-                except UnicodeDecodeError:
-                    decoded_text: str = text.decode(self.decoding)
-                except Exception as e:
-                    logger.error("解析文本 {0} 出错: {1}", text, e)
-                    raise DecodeError(e) from e
-            else:
-                try:
-                    decoded_text: str = text.decode(self.decoding)
-                except Exception as e:
-                    logger.error("解析文本 {0} 出错: {1}", text, e)
-                    raise DecodeError(e) from e
-            return decoded_text.rstrip("\n\r").lstrip("\n\r")
+                await self.__kill_server(self.proc)
+            return None
+        return [text.rstrip("\n\r").lstrip("\n\r") for text in lines]
 
     async def __parse_log(self, decoded_text: str):
         try:
@@ -209,57 +353,179 @@ class MinecraftServer:
             logger.warning(f"预解析服务端标准输出流失败，使用源文本: {e}")
 
         try:
-            parsed_result = self.handler.parse_server_stdout(decoded_text)
-            if parsed_result.is_from_console:
-                self.console_logger.info(f"{parsed_result.content}")
-            if parsed_result.is_from_server:
-                if parsed_result.is_player:
-                    self.server_logger.info(f"<{parsed_result.player}> {parsed_result.content}")
-                else:
-                    self.server_logger.info(f"{parsed_result.content}")
-        except Exception:
+            parsed_result = self.handler.try_parse_server_stdout(decoded_text)
+        except Exception as e:
+            logger.debug(f"解析服务端标准输出流失败: {e}")
+            parsed_result = None
+        if parsed_result is None:
             logger.info(decoded_text)
-        else:
-            # self.handler.detect_text(text)
-            await self.reactor_manager.put_info(parsed_result)
+            return
+
+        if parsed_result.is_from_console:
+            self.console_logger.info(f"{parsed_result.content}")
+        if parsed_result.is_from_server:
+            if parsed_result.is_player:
+                self.server_logger.info(f"<{parsed_result.player}> {parsed_result.content}")
+            else:
+                self.server_logger.info(f"{parsed_result.content}")
+        # self.handler.detect_text(text)
+        await self.reactor_manager.put_info(parsed_result)
+
+    def __on_server_start(self):
+        self.set_phase(ServerPhase.STARTING)
+        self.reactor_manager.on_server_start()
+
+    def __on_server_stop(self):
+        self.set_phase(ServerPhase.STOPPED)
+        self.reactor_manager.on_server_stop()
 
     async def loop(self):
-        await self.start_server()
+        # the infos of the last server process might still be in the queue
+        self.reactor_manager.call_after_queued_infos(self.__on_server_start)
+        self.__process_started.clear()
+        self.__stop_requested.clear()
+        self.__stopped.clear()
+        self.__launch_time = None
+        self.__return_code = None
+        try:
+            await self.start_server()
+            self.__launch_time = time.monotonic()
+        except BaseException:
+            self.__stopped.set()
+            raise
+        finally:
+            self.__process_started.set()
         self.server_runnning = True
-        self.broadcast.postEvent(ApplicationLaunching(self))
+        self.reactor_manager.post_event(ApplicationLaunching(self))
         if self.proc is None:
             raise ValueError("Minecraft Server 还未初始化.")
+        if self.proc.stdout is not None:
+            self.stdout_reader = ServerStdoutReader(
+                self.proc.stdout,
+                self.__create_stdout_decoder(),
+                self.config.stdout_read_mode,
+                self.config.stdout_chunk_size,
+            )
+            self.__reported_decode_error_count = 0
+        if self.proc.stdin is not None:
+            self.stdin_writer = ServerStdinWriter(
+                self.proc.stdin, self.config.stdin_buffer_size, self.config.stdin_buffer_overflow_policy
+            )
+            self.stdin_writer.start()
         while True:
-            if self.proc.returncode is not None:
+            # keep reading until EOF even if the process has exited, its last outputs might still be in the pipe
+            decoded_lines = await self.__receive()
+            if decoded_lines is None:
                 logger.info(f"return code: {self.proc.returncode}")
                 break
 
-            try:
-                decoded_text = await self.__receive()
-            except DecodeError as e:
-                logger.exception(e)
-                continue
-
-            if decoded_text is None:
-                break
-
-            await self.__parse_log(decoded_text)
+            for decoded_text in decoded_lines:
+                await self.__parse_log(decoded_text)
 
-            await asyncio.sleep(0.001)
+            # 每批处理完后让出控制权，避免大量输出时饿死其他任务
+            await asyncio.sleep(0)
         self.server_runnning = False
+        self.__return_code = self.proc.returncode
         with contextlib.suppress(Exception):
             self.proc.kill()
         self.proc = None
+        self.stdout_reader = None
+        self.disconnect_rcon()
+        if self.stdin_writer is not None:
+            self.stdin_writer.close()
+            self.stdin_writer = None
+        self.reactor_manager.call_after_queued_infos(self.__on_server_stop)
+        self.__process_started.clear()
+        self.__restart_requested = False
+        self.__stopped.set()
+
+    async def __sleep_unless_exiting(self, mgr: Launart, seconds: float) -> bool:
+        """
+        :return: False if the manager started exiting during the sleep
+        """
+        waiters = {asyncio.ensure_future(asyncio.sleep(seconds)), asyncio.ensure_future(mgr.status.wait_for_sigexit())}
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return not mgr.status.exiting
 
     async def run(self, mgr: Launart):
         self.mgr = mgr
+        self.reactor_manager.start()
+        restart_policy = RestartPolicy(self.config.auto_restart)
         while not mgr.status.exiting:
-            self.tasks.append(asyncio.create_task(self.loop()))
-            self.tasks.append(asyncio.create_task(self.check_stop(mgr)))
-            await asyncio.wait(self.tasks)
-            bcc = create(Broadcast)
-            bcc.postEvent(ApplicationShutdown(self))
-            for task in self.tasks:
+            tasks = [asyncio.create_task(self.loop()), asyncio.create_task(self.check_stop(mgr))]
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
                 task.cancel()
+            for task in tasks:
+                if not task.cancelled() and task.done() and task.exception() is not None:
+                    logger.opt(exception=task.exception()).error("服务端控制任务出现异常")
+            if mgr.status.exiting:
+                break
+            if self.__stop_requested.is_set():  # restart requested
+                self.reactor_manager.post_event(ApplicationRestarting(self, 0))
+                continue
+
+            uptime = 0.0 if self.__launch_time is None else time.monotonic() - self.__launch_time
+            self.reactor_manager.post_event(ApplicationCrashed(self, self.__return_code, uptime))
+            delay = restart_policy.on_crash(uptime)
+            if delay is None:
+                if self.config.auto_restart.enabled:
+                    logger.error(
+                        f"服务端在 {self.config.auto_restart.window}s 内已自动重启 "
+                        f"{self.config.auto_restart.max_restarts} 次，不再重启"
+                    )
+                else:
+                    logger.warning(f"服务端意外退出，返回码 {self.__return_code}，自动重启已禁用")
+                mgr.status.exiting = True
+                break
+            logger.warning(
+                f"服务端运行 {uptime:.1f}s 后意外退出，返回码 {self.__return_code}，"
+                f"将在 {delay:.1f}s 后自动重启（连续第 {restart_policy.consecutive_crashes} 次）"
+            )
+            self.reactor_manager.post_event(ApplicationRestarting(self, delay))
+            if delay > 0 and not await self.__sleep_unless_exiting(mgr, delay):
+                break
+        self.reactor_manager.post_event(ApplicationShutdown(self))
+        await self.reactor_manager.stop()
+
+    def connect_rcon(self):
+        """
+        Connect the rcon in the background if it's enabled in the config
+        """
+        if not self.config.rcon.enabled:
+            return
+        if self.__rcon_connect_task is not None:
+            self.__rcon_connect_task.cancel()
+        self.__rcon_connect_task = asyncio.create_task(self.__maintain_rcon())
+
+    async def __maintain_rcon(self):
+        if not await self.rcon_manager.connect():
+            return
+        while self.config.rcon.player_list_interval > 0:
+            await self.reconcile_online_players()
+            await asyncio.sleep(self.config.rcon.player_list_interval)
+
+    async def reconcile_online_players(self) -> bool:
+        """
+        Correct the online players with the result of the ``list`` command queried through rcon
+
+        :return: If the online players are corrected
+        """
+        response = await self.rcon_manager.query("list")
+        players = None if response is None else self.handler.parse_player_list(response)
+        if players is None:
+            return False
+        missing, extra = self.online_players.reconcile(players)
+        if missing or extra:
+            logger.warning(f"在线玩家与服务端不一致，已修正: 补上了 {list(missing)}，移除了 {list(extra)}")
+        return True
 
-    # TODO: connect RCON
+    def disconnect_rcon(self):
+        if self.__rcon_connect_task is not None:
+            self.__rcon_connect_task.cancel()
+            self.__rcon_connect_task = None
+        self.rcon_manager.disconnect()
@@ -1,5 +1,6 @@
+import asyncio
 import contextlib
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Pattern, Tuple, Union
 
 import psutil
 from launart import ExportInterface
@@ -29,11 +30,36 @@ class MinecraftServerInterface(ExportInterface["MinecraftServerService"]):
     #      Server Control
     # ------------------------
 
+    async def restart(self) -> bool:
+        """
+        Restart the server and wait for the new server process to start
+
+        Only the server process is relaunched. Plugins, configs, permissions and the info reactors stay loaded,
+        so it takes about as long as the server itself needs to start
+
+        :return: If the server is started again. False if the application is exiting instead
+        """
+        return await self.server.restart()
+
+    async def stop_and_wait(self, timeout: float | None = None) -> bool:
+        """
+        Stop the server and wait for the server process to exit
+
+        The application exits along with the server, the same as executing the stop command like ``stop``.
+        Use :meth:`restart` if you want the server to be started again
+
+        :param timeout: The maximum seconds to wait. None for no limit
+        :return: If the server stopped in time
+        """
+        if self.server.server_runnning:
+            await self.server.stop()
+        return await self.server.wait_for_stop(timeout)
+
     def is_rcon_running(self) -> bool:
         """
         Return if MCDR's rcon is running
         """
-        ...
+        return self.server.rcon_manager.is_running()
 
     def get_server_pid(self) -> int | None:
         """
@@ -71,14 +97,35 @@ class MinecraftServerInterface(ExportInterface["MinecraftServerService"]):
         """
         return self.server.server_information.copy()
 
+    def get_online_players(self) -> Tuple[str, ...]:
+        """
+        Return the names of the players online, in the order they joined
+
+        It's maintained from the player joined and left outputs of the server, so calling it costs nothing,
+        there's no need to execute ``list`` for it
+
+        :return: A tuple of the player names. It will be empty if the server is stopped
+        """
+        return self.server.online_players.get_players()
+
+    def is_online(self, player: str) -> bool:
+        """
+        Return if the player is online
+
+        :param player: The name of the player
+        """
+        return player in self.server.online_players
+
     # ------------------------
     #     Text Interaction
     # ------------------------
 
-    async def execute(self, text: str, *, encoding: str | None = None) -> None:
+    async def execute(self, text: str, *, encoding: str | None = None) -> asyncio.Future[None] | None:
         """
         Execute a server command by sending the command content to server's standard input stream
 
+        The command is written in the background, await the returned future if you need to know when it's written
+
         .. seealso::
 
             :meth:`execute_command` if you want to execute command in MCDR's command system
@@ -86,10 +133,74 @@ class MinecraftServerInterface(ExportInterface["MinecraftServerService"]):
         :param text: The content of the command you want to send
         :param encoding: The encoding method for the text.
             Leave it empty to use the encoding method from the configuration of MCDR
+        :return: A future resolved once the command is flushed to the server's standard input stream,
+            or cancelled if it's discarded because the buffer is full. None if the server is not running
         """
         logger.debug(f'Sending command "{text}"')
         await self.server.reactor_manager.put_info(Info(InfoSource.CONSOLE, raw_content=text))
-        await self.server.send(text, encoding=encoding)
+        return await self.server.send(text, encoding=encoding)
+
+    async def execute_many(
+        self, commands: Iterable[str], *, encoding: str | None = None
+    ) -> asyncio.Future[None] | None:
+        """
+        Execute some server commands, the same as :meth:`execute` for each of them, but much cheaper for a lot of them
+
+        The commands are written to the server's standard input stream together with a single write.
+        Unlike :meth:`execute`, the commands are not passed to the info reactors as console inputs
+
+        :param commands: The contents of the commands you want to send
+        :param encoding: The encoding method for the commands.
+            Leave it empty to use the encoding method from the configuration of MCDR
+        :return: A future resolved once all the commands are flushed to the server's standard input stream,
+            or cancelled if they're discarded because the buffer is full.
+            None if the server is not running or there's no command
+        """
+        commands = list(commands)
+        logger.debug(f"Sending {len(commands)} commands")
+        return await self.server.send_many(commands, encoding=encoding)
+
+    async def rcon_query(self, command: str, *, timeout: float | None = None) -> str | None:
+        """
+        Send a command to the server through rcon and return its response
+
+        Unlike :meth:`execute`, the response of the command is returned directly, so there's no need to look for it in
+        the output of the server. The queries are pipelined, so running many of them at the same time is cheap
+
+        :param command: The command you want to send to the rcon server
+        :param timeout: The maximum seconds to wait for the response. Leave it empty to use the timeout from the
+            configuration of MCDR
+        :return: The response of the command. None if rcon is not running or the query failed
+        """
+        return await self.server.rcon_manager.query(command, timeout)
+
+    async def execute_and_wait(
+        self, text: str, pattern: Union[str, Pattern[str]], timeout: float = 5, *, encoding: str | None = None
+    ) -> Info | None:
+        r"""
+        Execute a server command and wait for the output of the server matching the pattern,
+        e.g. ``await server.execute_and_wait("list", r"There are (\d+) of a max of (\d+) players online")``
+
+        Notes the outputs are only told apart by the pattern. Use a pattern as specific as possible,
+        or :meth:`rcon_query` if rcon is available
+
+        :param text: The content of the command you want to send
+        :param pattern: A regex matching the content of the output from its start, same as ``re.match``.
+            Leading literal text in the regex lets the output lookup skip most of the server outputs quickly
+        :param timeout: The maximum seconds to wait for the output
+        :param encoding: The encoding method for the text.
+            Leave it empty to use the encoding method from the configuration of MCDR
+        :return: The info of the matching output. None if it does not appear in time
+        """
+        waiters = self.server.reactor_manager.response_waiters
+        waiter = waiters.add(pattern)  # before executing, so the output can never be missed
+        try:
+            await self.execute(text, encoding=encoding)
+            return await asyncio.wait_for(waiter.future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters.remove(waiter)
 
     @property
     def __server_handler(self) -> "AbstractServerHandler":
@@ -105,10 +216,27 @@ class MinecraftServerInterface(ExportInterface["MinecraftServerService"]):
             Leave it empty to use the encoding method from the configuration of MCDR
         """
         # with RTextMCDRTranslation.language_context(self.server.preference_manager.get_preferred_language(player)):
-        command = self.__server_handler.get_send_message_command(player, text, self.get_server_information())
+        command = self.__server_handler.get_send_message_command(player, text, self.server.server_information)
         if command is not None:
             await self.execute(command, encoding=encoding)
 
+    async def tell_many(
+        self, players: Iterable[str], text: MessageText, *, encoding: str | None = None
+    ) -> asyncio.Future[None] | None:
+        """
+        Send the message to all the specific players, the same as :meth:`tell` for each of them,
+        but the message is only serialized once and all the commands are written at once, see :meth:`execute_many`
+
+        :param players: The names of the players you want to tell
+        :param text: The message you want to send to the players
+        :param encoding: The encoding method for the text.
+            Leave it empty to use the encoding method from the configuration of MCDR
+        :return: A future resolved once all the commands are flushed to the server's standard input stream,
+            or cancelled if they're discarded because the buffer is full. None if nothing is sent
+        """
+        commands = self.__server_handler.get_send_message_commands(players, text, self.server.server_information)
+        return await self.execute_many(commands, encoding=encoding)
+
     async def say(self, text: MessageText, *, encoding: str | None = None) -> None:
         """
         Use command like ``/tellraw @a`` to broadcast the message in game
@@ -117,7 +245,7 @@ class MinecraftServerInterface(ExportInterface["MinecraftServerService"]):
         :param encoding: The encoding method for the text.
             Leave it empty to use the encoding method from the configuration of MCDR
         """
-        command = self.__server_handler.get_broadcast_message_command(text, self.get_server_information())
+        command = self.__server_handler.get_broadcast_message_command(text, self.server.server_information)
         if command is not None:
             await self.execute(command, encoding=encoding)
 
@@ -0,0 +1,33 @@
+"""
+The lifecycle phases of the server
+"""
+from enum import Enum
+
+
+class ServerPhase(Enum):
+    """
+    The lifecycle phase of the server process
+    """
+
+    STOPPED = "stopped"
+    """The server process is not running"""
+    STARTING = "starting"
+    """The server process is started, but the server startup is not done yet"""
+    RUNNING = "running"
+    """The server startup is done"""
+    STOPPING = "stopping"
+    """The server is stopping"""
+
+    def can_enter(self, phase: "ServerPhase") -> bool:
+        """
+        If the phase can follow this phase, e.g. a server that is stopping never becomes running again
+        """
+        return phase in _NEXT_PHASES[self]
+
+
+_NEXT_PHASES = {
+    ServerPhase.STOPPED: {ServerPhase.STARTING},
+    ServerPhase.STARTING: {ServerPhase.RUNNING, ServerPhase.STOPPING, ServerPhase.STOPPED},
+    ServerPhase.RUNNING: {ServerPhase.STOPPING, ServerPhase.STOPPED},
+    ServerPhase.STOPPING: {ServerPhase.STOPPED},
+}
@@ -0,0 +1,152 @@
+"""
+Writing the commands to the standard input stream of the server
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from loguru import logger
+
+from .info_reactor.info_queue import T_OverflowPolicy
+
+BUFFER_FULL_WARN_INTERVAL_SEC = 5
+
+
+class ServerStdinWriter:
+    """
+    Writes the commands to the standard input stream of the server in a background task
+
+    The commands written while the task is busy are joined and written at once, then the task waits for the pipe to
+    be drained, so the transport never buffers more than its high-water mark.
+    The commands waiting for the task take at most ``max_buffered`` bytes, what happens beyond that is decided by
+    ``overflow_policy``
+    """
+
+    def __init__(
+        self, stream: asyncio.StreamWriter, max_buffered: int = 0, overflow_policy: T_OverflowPolicy = "block"
+    ):
+        """
+        :param stream: The standard input stream of the server
+        :param max_buffered: The maximum bytes of the commands waiting to be written. Zero or negative means unlimited
+        :param overflow_policy: What to do with a command that does not fit in the buffer.
+            ``block`` to wait for a free space, ``drop_oldest`` to discard the oldest waiting commands,
+            ``drop_newest`` to discard the command
+        """
+        self.stream = stream
+        self.max_buffered = max_buffered
+        self.overflow_policy = overflow_policy
+        self.__pending: Deque[Tuple[bytes, asyncio.Future]] = deque()
+        self.__writing: List[asyncio.Future] = []
+        self.__buffered = 0
+        self.__not_empty = asyncio.Event()
+        self.__not_full = asyncio.Event()
+        self.__not_full.set()
+        self.__task: Optional[asyncio.Task] = None
+        self.__closed = False
+        self.__last_full_warn_time: Optional[float] = None
+
+    @property
+    def buffered(self) -> int:
+        """
+        The bytes of the commands waiting to be written
+        """
+        return self.__buffered
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def start(self):
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__run())
+
+    def close(self):
+        """
+        Stop the writing task. The commands not written yet are discarded
+        """
+        self.__closed = True
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+        for future in self.__writing:
+            future.cancel()
+        self.__writing = []
+        while self.__pending:
+            self.__pending.popleft()[1].cancel()
+        self.__buffered = 0
+        self.__not_full.set()  # let the blocked writers see it's closed
+
+    def __is_full(self, size: int) -> bool:
+        # a command larger than the buffer still gets written once the buffer is empty
+        return 0 < self.max_buffered < self.__buffered + size and len(self.__pending) > 0
+
+    def __warn_buffer_full(self, message: str):
+        current_time = time.monotonic()
+        logging_method = logger.debug
+        if (
+            self.__last_full_warn_time is None
+            or current_time - self.__last_full_warn_time >= BUFFER_FULL_WARN_INTERVAL_SEC
+        ):
+            logging_method = logger.warning
+            self.__last_full_warn_time = current_time
+        logging_method(message)
+
+    async def write(self, data: bytes) -> asyncio.Future:
+        """
+        Put the data into the buffer
+
+        It only waits when the buffer is full and the overflow policy is ``block``
+
+        :return: A future resolved once the data is written and drained. It's cancelled if the data is discarded or
+            the writer is closed before that, and it never raises any other exception
+        """
+        future = asyncio.get_running_loop().create_future()
+        while not self.__closed and self.__is_full(len(data)):
+            if self.overflow_policy == "drop_oldest":
+                self.__warn_buffer_full("服务端标准输入流缓冲区已满，已丢弃最早的一条指令")
+                dropped, dropped_future = self.__pending.popleft()
+                self.__buffered -= len(dropped)
+                dropped_future.cancel()
+            elif self.overflow_policy == "drop_newest":
+                self.__warn_buffer_full("服务端标准输入流缓冲区已满，已丢弃最新的一条指令")
+                future.cancel()
+                return future
+            else:
+                self.__warn_buffer_full("服务端标准输入流缓冲区已满，正在等待写入")
+                self.__not_full.clear()
+                await self.__not_full.wait()
+        if self.__closed:
+            future.cancel()
+            return future
+        self.__pending.append((data, future))
+        self.__buffered += len(data)
+        self.__not_empty.set()
+        return future
+
+    async def flush(self):
+        """
+        Wait until all the data put so far is written and drained, or the writer is closed
+        """
+        await asyncio.wait({await self.write(b"")})
+
+    async def __run(self):
+        while True:
+            await self.__not_empty.wait()
+            self.__not_empty.clear()
+            batch = list(self.__pending)
+            self.__pending.clear()
+            self.__buffered = 0
+            self.__not_full.set()
+            self.__writing = [future for _, future in batch]
+            try:
+                self.stream.write(b"".join(data for data, _ in batch))
+                await self.stream.drain()
+            except ConnectionError as e:
+                logger.warning(f"向服务端标准输入流写入失败: {e}")
+                self.close()
+                return
+            for future in self.__writing:
+                if not future.done():
+                    future.set_result(None)
+            self.__writing = []
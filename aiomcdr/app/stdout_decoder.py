@@ -0,0 +1,77 @@
+"""
+Decoding the standard output stream of the server
+"""
+import codecs
+from typing import Optional, Sequence
+
+DECODE_ERROR_HANDLER = "aiomcdr.replace_and_count"
+
+_replaced_count = 0
+
+
+def _replace_and_count(error: UnicodeError):
+    global _replaced_count
+    if not isinstance(error, UnicodeDecodeError):
+        raise error
+    _replaced_count += 1
+    return "�", error.end
+
+
+codecs.register_error(DECODE_ERROR_HANDLER, _replace_and_count)
+
+
+class ServerStdoutDecoder:
+    """
+    An incremental decoder for the standard output stream of the server
+
+    Bytes can be fed in arbitrary pieces, a multibyte character split across two pieces is decoded correctly
+
+    If more than one candidate encoding is given, the encoding is detected only once,
+    with the first piece of data that contains non-ASCII bytes: the first candidate that decodes it without error wins,
+    otherwise the last candidate is used. Pure ASCII data decodes the same with every candidate,
+    so it is passed through before the detection
+
+    Undecodable bytes never raise, they are replaced with ``U+FFFD`` and counted in :attr:`error_count`
+    """
+
+    def __init__(self, candidates: Sequence[str]):
+        if len(candidates) == 0:
+            raise ValueError("At least one candidate encoding is required")
+        self.candidates = list(dict.fromkeys(codecs.lookup(encoding).name for encoding in candidates))
+        self.encoding: Optional[str] = None
+        """The encoding in use, None if it's not detected yet"""
+        self.error_count = 0
+        """The number of undecodable byte sequences so far"""
+        self.__decoder: Optional[codecs.IncrementalDecoder] = None
+        if len(self.candidates) == 1:
+            self.__use(self.candidates[0])
+
+    def __use(self, encoding: str):
+        self.encoding = encoding
+        self.__decoder = codecs.getincrementaldecoder(encoding)(DECODE_ERROR_HANDLER)
+
+    def __detect(self, data: bytes):
+        for encoding in self.candidates:
+            try:
+                codecs.getincrementaldecoder(encoding)("strict").decode(data)
+            except UnicodeDecodeError:
+                continue
+            self.__use(encoding)
+            return
+        self.__use(self.candidates[-1])
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        """
+        Decode a piece of data
+
+        :param data: The bytes read from the stream
+        :param final: If it's the last piece of the stream. Pending bytes of an incomplete character will be flushed
+        """
+        if self.__decoder is None:
+            if data.isascii():
+                return data.decode("ascii")
+            self.__detect(data)
+        replaced_count = _replaced_count
+        text = self.__decoder.decode(data, final)  # type: ignore
+        self.error_count += _replaced_count - replaced_count
+        return text
@@ -0,0 +1,62 @@
+"""
+Reading the standard output stream of the server
+"""
+import asyncio
+from typing import List, Literal, Optional
+
+from .stdout_decoder import ServerStdoutDecoder
+
+T_ReadMode = Literal["line", "chunk"]
+
+
+class ServerStdoutReader:
+    """
+    Reads the standard output stream of the server, decodes it and splits it into lines
+
+    In ``line`` mode it reads exactly one line at a time.
+    In ``chunk`` mode it reads as much as the pipe has buffered (up to ``chunk_size`` bytes),
+    splits it into lines in bulk and keeps the partial trailing line for the next read
+    """
+
+    def __init__(
+        self,
+        stream: asyncio.StreamReader,
+        decoder: ServerStdoutDecoder,
+        mode: T_ReadMode = "chunk",
+        chunk_size: int = 65536,
+    ):
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size should be a positive integer, got {chunk_size}")
+        self.stream = stream
+        self.decoder = decoder
+        self.mode: T_ReadMode = mode
+        self.chunk_size = chunk_size
+        self.__pending = ""
+
+    async def read_lines(self) -> Optional[List[str]]:
+        """
+        Read the next batch of lines from the stream, in order
+
+        The trailing ``\\n`` of each line is removed, but a ``\\r`` from the server might still be there
+
+        :return: A non-empty list of lines, or None if the stream reaches EOF
+        """
+        if self.mode == "line":
+            line = await self.stream.readline()
+            if not line:
+                tail = self.decoder.decode(b"", final=True)
+                return [tail] if tail else None
+            return [self.decoder.decode(line).rstrip("\n")]
+
+        while True:
+            chunk = await self.stream.read(self.chunk_size)
+            if not chunk:
+                self.__pending += self.decoder.decode(b"", final=True)
+                if self.__pending:
+                    lines, self.__pending = [self.__pending], ""
+                    return lines
+                return None
+            lines = (self.__pending + self.decoder.decode(chunk)).split("\n")
+            self.__pending = lines.pop()
+            if lines:
+                return lines
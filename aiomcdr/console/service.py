@@ -3,6 +3,7 @@ from graia.broadcast import Broadcast
 from graia.saya import Saya
 from launart import Launart, Launchable
 
+from ..app.service import MinecraftServerInterface
 from ..event.lifetime import ApplicationShutdowned
 from . import Console
 from .saya import ConsoleBehaviour
@@ -26,6 +27,18 @@ class ConsoleService(Launchable):
         saya.install_behaviours(ConsoleBehaviour(con))
         con.start()
 
+        @con.register()
+        async def _(command: str):
+            """!!listeners 查看插件监听器的耗时, !!listeners reset 清空统计"""
+            args = command.split()
+            if not args or args[0] != "!!listeners":
+                return
+            metrics = mgr.get_interface(MinecraftServerInterface).server.reactor_manager.listener_metrics
+            if args[1:] == ["reset"]:
+                metrics.reset()
+                return "已清空监听器耗时统计"
+            return "\n" + metrics.format_table()
+
         @bcc.receiver(ApplicationShutdowned)
         async def _():
             con.stop()
@@ -0,0 +1,58 @@
+"""事件参数注入的查找表"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from aiomcdr.typing import generic_issubclass
+
+Getter = Callable[[Any], Any]
+
+
+class DispatchPlan:
+    """按监听器参数的注解缓存注入方式, 每个注解只做一次类型判断, 之后的注入只是一次查表
+
+    候选项为 (类型, 取值函数) 的序列, 按顺序取第一个类型满足注解的取值函数, 即与逐个调用 ``generic_issubclass`` 的结果相同.
+    候选项在第一次使用时才生成, 以便其中引用需要延迟导入的类
+    """
+
+    def __init__(self, get_candidates: Callable[[], Sequence[Tuple[type, Getter]]]) -> None:
+        """
+        Args:
+            get_candidates (Callable[[], Sequence[Tuple[type, Getter]]]): 生成候选项的函数
+        """
+        self.__get_candidates = get_candidates
+        self.__candidates: Optional[List[Tuple[type, Getter]]] = None
+        self.__getters: Dict[Any, Optional[Getter]] = {}
+
+    def __resolve(self, annotation: Any) -> Optional[Getter]:
+        if self.__candidates is None:
+            self.__candidates = list(self.__get_candidates())
+        return next((getter for cls, getter in self.__candidates if generic_issubclass(cls, annotation)), None)
+
+    def get_getter(self, annotation: Any) -> Optional[Getter]:
+        """获取注解对应的取值函数
+
+        Args:
+            annotation (Any): 监听器参数的注解
+
+        Returns:
+            Optional[Getter]: 取值函数, 没有满足注解的候选项时为 None
+        """
+        try:
+            return self.__getters[annotation]
+        except KeyError:
+            getter = self.__getters[annotation] = self.__resolve(annotation)
+            return getter
+        except TypeError:  # 注解不可哈希, 不缓存
+            return self.__resolve(annotation)
+
+    def dispatch(self, event: Any, annotation: Any) -> Any:
+        """从事件中取出注解对应的值
+
+        Args:
+            event (Any): 事件
+            annotation (Any): 监听器参数的注解
+
+        Returns:
+            Any: 要注入的值, 无法注入时为 None
+        """
+        getter = self.get_getter(annotation)
+        return None if getter is None else getter(event)
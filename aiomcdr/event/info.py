@@ -1,12 +1,16 @@
-from typing import TYPE_CHECKING, Union
+import re
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, List, Optional, Pattern, Tuple, Union
 
 from graia.broadcast.entities.dispatcher import BaseDispatcher
 from graia.broadcast.entities.event import Dispatchable
+from graia.broadcast.exceptions import ExecutionStop
 from graia.broadcast.interfaces.dispatcher import DispatcherInterface
 
 from aiomcdr.app.command.command_source import InfoCommandSource
 from aiomcdr.app.info_reactor.info import Info
-from aiomcdr.typing import generic_issubclass
+from aiomcdr.event.dispatch_plan import DispatchPlan
+from aiomcdr.typing import get_origin
 
 if TYPE_CHECKING:
     from aiomcdr.app.server import MinecraftServer
@@ -27,18 +31,113 @@ class InfoEvent(Dispatchable):
     class Dispatcher(BaseDispatcher):
         @staticmethod
         async def catch(interface: "DispatcherInterface"):
-            from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
-
             if isinstance(interface.event, InfoEvent):
-                if generic_issubclass(MinecraftServer, interface.annotation):
-                    return interface.event.server
-                if generic_issubclass(MinecraftServerInterface, interface.annotation):
-                    return interface.event.server.server_interface
-                if generic_issubclass(Info, interface.annotation):
-                    return interface.event.info
-                if generic_issubclass(InfoCommandSource, interface.annotation):
-                    return interface.event.source
+                return _info_event_plan.dispatch(interface.event, interface.annotation)
+
+
+def _get_info_event_candidates():
+    from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
+
+    return [
+        (MinecraftServer, attrgetter("server")),
+        (MinecraftServerInterface, attrgetter("server.server_interface")),
+        (Info, attrgetter("info")),
+        (InfoCommandSource, attrgetter("source")),
+    ]
+
+
+_info_event_plan = DispatchPlan(_get_info_event_candidates)
 
 
 class UserInfoEvent(InfoEvent):
     """指示玩家发送的消息."""
+
+
+class InfoBatchEvent(Dispatchable):
+    """指示一批消息（Info），供需要全部消息的插件批量处理.
+
+    仅在有监听器时才会收集，消息数达到 ``info_batch_size`` 或最早的消息等待超过 ``info_batch_window`` 秒时广播。
+    消息按信息反应器处理的顺序排列，可以用 ``List[Info]`` 注解获取。
+    """
+
+    server: "MinecraftServer"
+    infos: List[Info]
+
+    def __init__(self, server: "MinecraftServer", infos: List[Info]) -> None:
+        self.server = server
+        self.infos = infos
+
+    class Dispatcher(BaseDispatcher):
+        @staticmethod
+        async def catch(interface: "DispatcherInterface"):
+            if isinstance(interface.event, InfoBatchEvent):
+                if get_origin(interface.annotation) is list:
+                    return interface.event.infos
+                return _info_batch_event_plan.dispatch(interface.event, interface.annotation)
+
+
+def _get_info_batch_event_candidates():
+    from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
+
+    return [
+        (MinecraftServer, attrgetter("server")),
+        (MinecraftServerInterface, attrgetter("server.server_interface")),
+    ]
+
+
+_info_batch_event_plan = DispatchPlan(_get_info_batch_event_candidates)
+
+
+class InfoFilter(BaseDispatcher):
+    """限定监听器只接收内容符合条件的消息（Info），用法: ``@dispatch(InfoFilter(prefix="UUID of player "))``.
+
+    前缀、正则与日志等级之间为“与”的关系，给出多个前缀或日志等级时满足其一即可。
+    信息反应器会按前缀为监听器建立索引，只调用过滤条件匹配的监听器。
+    """
+
+    prefixes: Tuple[str, ...]
+    regex: Optional[Pattern[str]]
+    logging_levels: Tuple[str, ...]
+
+    def __init__(
+        self,
+        prefix: Union[str, Iterable[str], None] = None,
+        regex: Union[str, Pattern[str], None] = None,
+        logging_level: Union[str, Iterable[str], None] = None,
+    ) -> None:
+        """
+        :param prefix: 消息内容的开头，区分大小写
+        :param regex: 从消息内容开头匹配的正则表达式，同 ``re.match``
+        :param logging_level: 消息的日志等级，如 ``"INFO"``，不区分大小写
+        """
+        self.prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix or ())
+        self.regex = re.compile(regex) if isinstance(regex, str) else regex
+        levels = (logging_level,) if isinstance(logging_level, str) else tuple(logging_level or ())
+        self.logging_levels = tuple(level.upper() for level in levels)
+
+    def match(self, info: Info) -> bool:
+        """判断消息是否符合过滤条件."""
+        content = info.content
+        if self.prefixes and (content is None or not content.startswith(self.prefixes)):
+            return False
+        if self.regex is not None and (content is None or self.regex.match(content) is None):
+            return False
+        if self.logging_levels:
+            logging_level = info.logging_level
+            if logging_level is None or logging_level.upper() not in self.logging_levels:
+                return False
+        return True
+
+    async def beforeExecution(self, interface: "DispatcherInterface"):
+        # 事件未经信息反应器的索引而直接广播时，在这里兜底过滤
+        if isinstance(interface.event, InfoEvent) and not self.match(interface.event.info):
+            raise ExecutionStop
+
+    async def catch(self, interface: "DispatcherInterface"):
+        return None
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}[prefixes={self.prefixes!r}, regex={self.regex!r}, "
+            f"logging_levels={self.logging_levels!r}]"
+        )
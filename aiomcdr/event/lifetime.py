@@ -1,11 +1,12 @@
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Optional
 
 from graia.broadcast.entities.dispatcher import BaseDispatcher
 from graia.broadcast.entities.event import Dispatchable
 from graia.broadcast.interfaces.dispatcher import DispatcherInterface
 from graia.saya.event import SayaModuleInstalled
 
-from aiomcdr.typing import generic_issubclass
+from aiomcdr.event.dispatch_plan import DispatchPlan
 
 if TYPE_CHECKING:
     from aiomcdr.app.server import MinecraftServer
@@ -22,13 +23,20 @@ class ApplicationLifecycleEvent(Dispatchable):
     class Dispatcher(BaseDispatcher):
         @staticmethod
         async def catch(interface: "DispatcherInterface"):
-            from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
-
             if isinstance(interface.event, ApplicationLifecycleEvent):
-                if generic_issubclass(MinecraftServer, interface.annotation):
-                    return interface.event.server
-                if generic_issubclass(MinecraftServerInterface, interface.annotation):
-                    return interface.event.server.server_interface
+                return _lifecycle_event_plan.dispatch(interface.event, interface.annotation)
+
+
+def _get_lifecycle_event_candidates():
+    from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
+
+    return [
+        (MinecraftServer, attrgetter("server")),
+        (MinecraftServerInterface, attrgetter("server.server_interface")),
+    ]
+
+
+_lifecycle_event_plan = DispatchPlan(_get_lifecycle_event_candidates)
 
 
 class ApplicationLaunching(ApplicationLifecycleEvent):
@@ -43,4 +51,33 @@ class ApplicationShutdown(ApplicationLifecycleEvent):
     """指示 MinecraftServer 关闭."""
 
 
+class ApplicationCrashed(ApplicationLifecycleEvent):
+    """指示 MinecraftServer 在未被要求关闭时退出，或启动失败."""
+
+    return_code: Optional[int]
+    uptime: float
+
+    def __init__(self, server: "MinecraftServer", return_code: Optional[int], uptime: float) -> None:
+        """
+        :param return_code: 服务端进程的返回码，启动失败时为 None
+        :param uptime: 服务端运行的秒数
+        """
+        super().__init__(server)
+        self.return_code = return_code
+        self.uptime = uptime
+
+
+class ApplicationRestarting(ApplicationLifecycleEvent):
+    """指示 MinecraftServer 将被重新启动，可能是崩溃后的自动重启，也可能是插件要求的重启."""
+
+    delay: float
+
+    def __init__(self, server: "MinecraftServer", delay: float) -> None:
+        """
+        :param delay: 重新启动前等待的秒数
+        """
+        super().__init__(server)
+        self.delay = delay
+
+
 ApplicationShutdowned = ApplicationShutdown
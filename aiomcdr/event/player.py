@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from graia.broadcast.entities.dispatcher import BaseDispatcher
@@ -5,7 +6,7 @@ from graia.broadcast.entities.event import Dispatchable
 from graia.broadcast.interfaces.dispatcher import DispatcherInterface
 
 from aiomcdr.app.info_reactor.info import Info
-from aiomcdr.typing import generic_issubclass
+from aiomcdr.event.dispatch_plan import DispatchPlan
 
 if TYPE_CHECKING:
     from aiomcdr.app.server import MinecraftServer
@@ -26,17 +27,22 @@ class PlayerEvent(Dispatchable):
     class Dispatcher(BaseDispatcher):
         @staticmethod
         async def catch(interface: "DispatcherInterface"):
-            from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
-
             if isinstance(interface.event, PlayerEvent):
-                if generic_issubclass(MinecraftServer, interface.annotation):
-                    return interface.event.server
-                if generic_issubclass(MinecraftServerInterface, interface.annotation):
-                    return interface.event.server.server_interface
-                if generic_issubclass(str, interface.annotation):
-                    return interface.event.name
-                if generic_issubclass(Info, interface.annotation):
-                    return interface.event.info
+                return _player_event_plan.dispatch(interface.event, interface.annotation)
+
+
+def _get_player_event_candidates():
+    from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
+
+    return [
+        (MinecraftServer, attrgetter("server")),
+        (MinecraftServerInterface, attrgetter("server.server_interface")),
+        (str, attrgetter("name")),
+        (Info, attrgetter("info")),
+    ]
+
+
+_player_event_plan = DispatchPlan(_get_player_event_candidates)
 
 
 class PlayerJoinedEvent(PlayerEvent):
@@ -45,3 +51,27 @@ class PlayerJoinedEvent(PlayerEvent):
 
 class PlayerLeftEvent(PlayerEvent):
     """指示玩家离开游戏."""
+
+
+class PlayerChatEvent(PlayerEvent):
+    """指示玩家在游戏中发送了聊天消息."""
+
+    message: str
+
+    def __init__(self, server: "MinecraftServer", name: str, info: Info) -> None:
+        super().__init__(server, name, info)
+        self.message = info.content or ""
+
+
+class PlayerDeathEvent(PlayerEvent):
+    """指示玩家死亡, 死亡消息为 ``info.content``."""
+
+
+class PlayerAdvancementEvent(PlayerEvent):
+    """指示玩家取得了进度."""
+
+    advancement: str
+
+    def __init__(self, server: "MinecraftServer", name: str, info: Info, advancement: str) -> None:
+        super().__init__(server, name, info)
+        self.advancement = advancement
@@ -0,0 +1,50 @@
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from graia.broadcast.entities.dispatcher import BaseDispatcher
+from graia.broadcast.entities.event import Dispatchable
+from graia.broadcast.interfaces.dispatcher import DispatcherInterface
+
+from aiomcdr.app.info_reactor.info import Info
+from aiomcdr.event.dispatch_plan import DispatchPlan
+
+if TYPE_CHECKING:
+    from aiomcdr.app.server import MinecraftServer
+
+
+class ServerEvent(Dispatchable):
+    """指示从服务端输出中识别出的有关服务端的事件."""
+
+    server: "MinecraftServer"
+    info: Info
+
+    def __init__(self, server: "MinecraftServer", info: Info) -> None:
+        self.server = server
+        self.info = info
+
+    class Dispatcher(BaseDispatcher):
+        @staticmethod
+        async def catch(interface: "DispatcherInterface"):
+            if isinstance(interface.event, ServerEvent):
+                return _server_event_plan.dispatch(interface.event, interface.annotation)
+
+
+def _get_server_event_candidates():
+    from aiomcdr.app.server import MinecraftServer, MinecraftServerInterface
+
+    return [
+        (MinecraftServer, attrgetter("server")),
+        (MinecraftServerInterface, attrgetter("server.server_interface")),
+        (Info, attrgetter("info")),
+    ]
+
+
+_server_event_plan = DispatchPlan(_get_server_event_candidates)
+
+
+class RconStartedEvent(ServerEvent):
+    """指示服务端的 RCON 已启动."""
+
+
+class ServerStoppingEvent(ServerEvent):
+    """指示服务端正在关闭, 在一次服务端生命周期中可能出现多次."""
@@ -1,4 +1,6 @@
 import contextlib
+import functools
+import itertools
 import sys
 import types
 from typing import TYPE_CHECKING, Annotated, Any, Tuple, TypeVar, Union
@@ -18,36 +20,76 @@ def get_origin(obj: Any) -> Any:
     return typing_extensions.get_origin(obj) or obj
 
 
-def generic_issubclass(cls: Any, par: Union[type, Any, Tuple[type, ...]]) -> bool:
-    """检查 cls 是否是 args 中的一个子类, 支持泛型, Any, Union
+@functools.lru_cache(maxsize=4096)
+def _flatten_annotation(par: Union[type, Any, Tuple[type, ...]]) -> Tuple[Any, ...]:
+    """把注解展开为可直接用于 isinstance / issubclass 的候选项, 其中的 Any 表示任意类型均可
 
     Args:
-        cls (type): 要检查的类
-        par (Union[type, Any, Tuple[type, ...]]): 要检查的类的父类
+        par (Union[type, Any, Tuple[type, ...]]): 要展开的注解
 
     Returns:
-        bool: 是否是父类
+        Tuple[Any, ...]: 候选项, 满足其一即可
     """
     if par is Any:
-        return True
+        return (Any,)
     with contextlib.suppress(TypeError):
         if isinstance(par, AnnotatedType):
-            return generic_issubclass(cls, get_args(par)[0])
+            return _get_annotation_candidates(get_args(par)[0])
         if isinstance(par, (type, tuple)):
-            return issubclass(cls, par)
+            return (par,)
         if get_origin(par) in Unions:
-            return any(generic_issubclass(cls, p) for p in get_args(par))
+            return tuple(itertools.chain.from_iterable(_get_annotation_candidates(p) for p in get_args(par)))
         if isinstance(par, TypeVar):
             if par.__constraints__:
-                return any(generic_issubclass(cls, p) for p in par.__constraints__)
+                return tuple(itertools.chain.from_iterable(_get_annotation_candidates(p) for p in par.__constraints__))
             if par.__bound__:
-                return generic_issubclass(cls, par.__bound__)
+                return _get_annotation_candidates(par.__bound__)
+    return ()
+
+
+def _get_annotation_candidates(par: Union[type, Any, Tuple[type, ...]]) -> Tuple[Any, ...]:
+    try:
+        return _flatten_annotation(par)
+    except TypeError:  # 注解不可哈希, 如 Annotated 的元数据中有列表, 不缓存
+        return _flatten_annotation.__wrapped__(par)
+
+
+def _generic_issubclass(cls: Any, par: Union[type, Any, Tuple[type, ...]]) -> bool:
+    for candidate in _get_annotation_candidates(par):
+        if candidate is Any:
+            return True
+        with contextlib.suppress(TypeError):
+            if issubclass(cls, candidate):
+                return True
     return False
 
 
+_cached_generic_issubclass = functools.lru_cache(maxsize=4096)(_generic_issubclass)
+
+
+def generic_issubclass(cls: Any, par: Union[type, Any, Tuple[type, ...]]) -> bool:
+    """检查 cls 是否是 args 中的一个子类, 支持泛型, Any, Union
+
+    结果按 (cls, par) 缓存, 不可哈希的注解则每次重新检查
+
+    Args:
+        cls (type): 要检查的类
+        par (Union[type, Any, Tuple[type, ...]]): 要检查的类的父类
+
+    Returns:
+        bool: 是否是父类
+    """
+    try:
+        return _cached_generic_issubclass(cls, par)
+    except TypeError:
+        return _generic_issubclass(cls, par)
+
+
 def generic_isinstance(obj: Any, par: Union[type, Any, Tuple[type, ...]]) -> bool:
     """检查 obj 是否是 args 中的一个类型, 支持泛型, Any, Union
 
+    注解的展开结果按 par 缓存, 对 obj 的 isinstance 检查则每次进行
+
     Args:
         obj (Any): 要检查的对象
         par (Union[type, Any, Tuple[type, ...]]): 要检查的对象的类型
@@ -55,18 +97,10 @@ def generic_isinstance(obj: Any, par: Union[type, Any, Tuple[type, ...]]) -> boo
     Returns:
         bool: 是否是类型
     """
-    if par is Any:
-        return True
-    with contextlib.suppress(TypeError):
-        if isinstance(par, AnnotatedType):
-            return generic_isinstance(obj, get_args(par)[0])
-        if isinstance(par, (type, tuple)):
-            return isinstance(obj, par)
-        if get_origin(par) in Unions:
-            return any(generic_isinstance(obj, p) for p in get_args(par))
-        if isinstance(par, TypeVar):
-            if par.__constraints__:
-                return any(generic_isinstance(obj, p) for p in par.__constraints__)
-            if par.__bound__:
-                return generic_isinstance(obj, par.__bound__)
+    for candidate in _get_annotation_candidates(par):
+        if candidate is Any:
+            return True
+        with contextlib.suppress(TypeError):
+            if isinstance(obj, candidate):
+                return True
     return False
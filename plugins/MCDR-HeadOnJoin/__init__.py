@@ -10,14 +10,14 @@ from uuid import UUID
 
 import aiohttp
 import orjson
-from graiax.shortcut import listen
+from graiax.shortcut import dispatch, listen
 from kayaku import config, create, save
 from loguru import logger
 
 from aiomcdr.app.config import MCDRConfig
 from aiomcdr.app.info_reactor.info import Info
 from aiomcdr.app.server_interface import MinecraftServerInterface
-from aiomcdr.event.info import InfoEvent
+from aiomcdr.event.info import InfoEvent, InfoFilter
 from aiomcdr.event.lifetime import ApplicationLaunched
 from aiomcdr.event.player import PlayerJoinedEvent
 
@@ -132,11 +132,10 @@ async def get_player_uuid(player_name: str) -> dict | int:
 
 
 @listen(InfoEvent)
+@dispatch(InfoFilter(prefix="UUID of player "))
 async def on_info(info: Info):
     if info.content is None or not info.is_from_server:
         return
-    if info.content.startswith("UUID of player"):
-        return
     re_result = re.match(
         r"(UUID\ of\ player\ )(\S+)(\ is\ )([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})", info.content
     )